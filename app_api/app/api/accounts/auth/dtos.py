@@ -4,18 +4,16 @@ This module defines the data structures used for authentication requests
 and their corresponding Litestar DTOs for validation and serialization.
 """
 
-from dataclasses import dataclass
+from litestar.dto import MsgspecDTO
+from msgspec import Struct
 
-from litestar.dto import DataclassDTO
 
-
-@dataclass
-class Login:
+class Login(Struct):
     """Login credentials."""
 
     username: str
     password: str
 
 
-class LoginDTO(DataclassDTO[Login]):
+class LoginDTO(MsgspecDTO[Login]):
     """DTO for login."""
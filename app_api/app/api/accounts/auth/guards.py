@@ -2,9 +2,13 @@
 
 This module provides guard functions for Litestar route handlers to enforce
 permission-based access control using the existing Permission model.
+
+The guard factories are memoized, so route handlers declaring the same
+requirement share a single guard function.
 """
 
 from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 from litestar.connection import ASGIConnection
@@ -14,7 +18,7 @@ from litestar.handlers.base import BaseRouteHandler
 from app.config import Settings
 from app.models.accounts import User
 
-from .permissions import get_user_permissions
+from .permissions import UserAccess, get_user_access, load_user_access
 
 
 def _get_authenticated_user(connection: ASGIConnection[Any, Any, Any, Any]) -> User:
@@ -37,22 +41,26 @@ def _get_authenticated_user(connection: ASGIConnection[Any, Any, Any, Any]) -> U
     return user
 
 
-def _is_superuser(connection: ASGIConnection[Any, Any, Any, Any], user: User) -> bool:
-    """Check if the user has the superuser role.
+def _get_user_access(connection: ASGIConnection[Any, Any, Any, Any], user: User) -> UserAccess:
+    """Get the precomputed access information of the authenticated user.
 
     Args:
         connection: The ASGI connection (to access settings)
-        user: The user to check
+        user: The authenticated user
 
     Returns:
-        True if the user has the superuser role, False otherwise
+        The user's access information, computed on demand if it was not attached
+        when the user was loaded
 
     """
-    settings: Settings = connection.app.state.app_settings
-    user_role_names = {role.name for role in user.roles if role.is_active}
-    return settings.superuser_role_name in user_role_names
+    access = get_user_access(user)
+    if access is None:
+        settings: Settings = connection.app.state.app_settings
+        access = load_user_access(user, settings.superuser_role_name)
+    return access
 
 
+@cache
 def has_permission(
     resource: str,
     action: str,
@@ -72,22 +80,24 @@ def has_permission(
             ...
 
     """
+    required = (resource, action)
+    denied_msg = f"Permission denied: requires '{resource}:{action}'"
 
     def guard(connection: ASGIConnection[Any, Any, Any, Any], _: BaseRouteHandler) -> None:
         """Check if the authenticated user has the required permission."""
         user = _get_authenticated_user(connection)
 
-        if _is_superuser(connection, user):
+        access = _get_user_access(connection, user)
+        if access.is_superuser:
             return
 
-        user_permissions = get_user_permissions(user)
-        if (resource, action) not in user_permissions:
-            msg = f"Permission denied: requires '{resource}:{action}'"
-            raise PermissionDeniedException(msg)
+        if required not in access.permissions:
+            raise PermissionDeniedException(denied_msg)
 
     return guard
 
 
+@cache
 def has_any_permission(
     *permissions: tuple[str, str],
 ) -> Callable[[ASGIConnection[Any, Any, Any, Any], BaseRouteHandler], None]:
@@ -105,26 +115,27 @@ def has_any_permission(
             ...
 
     """
+    required = frozenset(permissions)
+    permissions_str = ", ".join(f"'{r}:{a}'" for r, a in permissions)
+    denied_msg = f"Permission denied: requires one of [{permissions_str}]"
 
     def guard(connection: ASGIConnection[Any, Any, Any, Any], _: BaseRouteHandler) -> None:
         """Check if user has any of the required permissions."""
         user = _get_authenticated_user(connection)
 
-        if _is_superuser(connection, user):
+        access = _get_user_access(connection, user)
+        if access.is_superuser:
             return
 
-        user_permissions = get_user_permissions(user)
-        for resource, action in permissions:
-            if (resource, action) in user_permissions:
-                return
+        if not required.isdisjoint(access.permissions):
+            return
 
-        permissions_str = ", ".join(f"'{r}:{a}'" for r, a in permissions)
-        msg = f"Permission denied: requires one of [{permissions_str}]"
-        raise PermissionDeniedException(msg)
+        raise PermissionDeniedException(denied_msg)
 
     return guard
 
 
+@cache
 def has_all_permissions(
     *permissions: tuple[str, str],
 ) -> Callable[[ASGIConnection[Any, Any, Any, Any], BaseRouteHandler], None]:
@@ -142,28 +153,26 @@ def has_all_permissions(
             ...
 
     """
+    required = frozenset(permissions)
 
     def guard(connection: ASGIConnection[Any, Any, Any, Any], _: BaseRouteHandler) -> None:
         """Check if user has all required permissions."""
         user = _get_authenticated_user(connection)
 
-        if _is_superuser(connection, user):
+        access = _get_user_access(connection, user)
+        if access.is_superuser:
             return
 
-        user_permissions = get_user_permissions(user)
-        missing_permissions = []
-        for resource, action in permissions:
-            if (resource, action) not in user_permissions:
-                missing_permissions.append(f"{resource}:{action}")
-
-        if missing_permissions:
-            missing_str = ", ".join(f"'{p}'" for p in missing_permissions)
+        missing = required - access.permissions
+        if missing:
+            missing_str = ", ".join(f"'{r}:{a}'" for r, a in permissions if (r, a) in missing)
             msg = f"Permission denied: missing [{missing_str}]"
             raise PermissionDeniedException(msg)
 
     return guard
 
 
+@cache
 def has_role(
     *role_names: str,
 ) -> Callable[[ASGIConnection[Any, Any, Any, Any], BaseRouteHandler], None]:
@@ -181,23 +190,24 @@ def has_role(
             ...
 
     """
+    required = frozenset(role_names)
+    roles_str = ", ".join(f"'{r}'" for r in role_names)
+    denied_msg = f"Permission denied: requires one of roles [{roles_str}]"
 
     def guard(connection: ASGIConnection[Any, Any, Any, Any], _: BaseRouteHandler) -> None:
         """Check if user has any of the required roles."""
         user = _get_authenticated_user(connection)
 
+        access = _get_user_access(connection, user)
+
         # Superuser role bypasses role requirements
-        if _is_superuser(connection, user):
+        if access.is_superuser:
             return
 
         # Check if user has any of the required roles
-        user_role_names = {role.name for role in user.roles if role.is_active}
-        for role_name in role_names:
-            if role_name in user_role_names:
-                return
+        if not required.isdisjoint(access.role_names):
+            return
 
-        roles_str = ", ".join(f"'{r}'" for r in role_names)
-        msg = f"Permission denied: requires one of roles [{roles_str}]"
-        raise PermissionDeniedException(msg)
+        raise PermissionDeniedException(denied_msg)
 
     return guard
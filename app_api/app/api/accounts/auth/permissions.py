@@ -4,7 +4,87 @@ This module provides helper functions for programmatically checking user permiss
 within application code, complementing the guard-based approach for route handlers.
 """
 
-from app.models.accounts import User
+from dataclasses import dataclass
+from itertools import chain
+
+from sqlalchemy import inspect
+
+from app.models.accounts import Role, User
+
+_USER_ACCESS_KEY = "user_access"
+_ROLE_PERMISSIONS_KEY = "role_permissions"
+
+
+@dataclass(frozen=True, slots=True)
+class UserAccess:
+    """Access information derived from a user's active roles and permissions."""
+
+    permissions: frozenset[tuple[str, str]]
+    role_names: frozenset[str]
+    is_superuser: bool
+
+
+def load_user_access(user: User, superuser_role_name: str) -> UserAccess:
+    """Compute a user's access information and attach it to the user instance.
+
+    Once attached, the permission helpers in this module and the route guards
+    use the precomputed sets instead of walking the user's roles on every check.
+
+    Args:
+        user: The user to compute access information for
+        superuser_role_name: Name of the role that bypasses permission checks
+
+    Returns:
+        The computed access information
+
+    """
+    active_roles = [role for role in user.roles if role.is_active]
+    role_names = frozenset(role.name for role in active_roles)
+    access = UserAccess(
+        permissions=frozenset(chain.from_iterable(map(get_role_permissions, active_roles))),
+        role_names=role_names,
+        is_superuser=superuser_role_name in role_names,
+    )
+    inspect(user).info[_USER_ACCESS_KEY] = access
+    return access
+
+
+def get_role_permissions(role: Role) -> frozenset[tuple[str, str]]:
+    """Get the active permissions granted by a role as (resource, action) tuples.
+
+    The set is computed once per loaded role instance and kept on its instance
+    state, so roles shared by several users are only walked once.
+
+    Args:
+        role: The role to get permissions for
+
+    Returns:
+        Set of (resource, action) tuples for the role's active permissions
+
+    """
+    info = inspect(role).info
+    permissions = info.get(_ROLE_PERMISSIONS_KEY)
+    if permissions is None:
+        permissions = frozenset(
+            (permission.resource, permission.action)
+            for permission in role.permissions
+            if permission.is_active
+        )
+        info[_ROLE_PERMISSIONS_KEY] = permissions
+    return permissions
+
+
+def get_user_access(user: User) -> UserAccess | None:
+    """Get the access information previously attached by :func:`load_user_access`.
+
+    Args:
+        user: The user to get access information for
+
+    Returns:
+        The attached access information, or None if it was not computed
+
+    """
+    return inspect(user).info.get(_USER_ACCESS_KEY)
 
 
 def user_has_permission(user: User, resource: str, action: str) -> bool:
@@ -24,13 +104,7 @@ def user_has_permission(user: User, resource: str, action: str) -> bool:
             ...
 
     """
-    for role in user.roles:
-        if not role.is_active:
-            continue
-        for permission in role.permissions:
-            if permission.is_active and permission.resource == resource and permission.action == action:
-                return True
-    return False
+    return (resource, action) in get_user_permissions(user)
 
 
 def user_has_any_permission(user: User, *permissions: tuple[str, str]) -> bool:
@@ -73,7 +147,7 @@ def user_has_all_permissions(user: User, *permissions: tuple[str, str]) -> bool:
     return all((resource, action) in user_permissions for resource, action in permissions)
 
 
-def get_user_permissions(user: User) -> set[tuple[str, str]]:
+def get_user_permissions(user: User) -> frozenset[tuple[str, str]]:
     """Get all permissions for a user as (resource, action) tuples.
 
     Args:
@@ -90,14 +164,13 @@ def get_user_permissions(user: User) -> set[tuple[str, str]]:
             ...
 
     """
-    permissions = set()
-    for role in user.roles:
-        if not role.is_active:
-            continue
-        for permission in role.permissions:
-            if permission.is_active:
-                permissions.add((permission.resource, permission.action))
-    return permissions
+    access = get_user_access(user)
+    if access is not None:
+        return access.permissions
+
+    return frozenset(
+        chain.from_iterable(get_role_permissions(role) for role in user.roles if role.is_active),
+    )
 
 
 def user_has_role(user: User, *role_names: str) -> bool:
@@ -116,5 +189,9 @@ def user_has_role(user: User, *role_names: str) -> bool:
             ...
 
     """
-    user_role_names = {role.name for role in user.roles if role.is_active}
+    access = get_user_access(user)
+    if access is not None:
+        user_role_names = access.role_names
+    else:
+        user_role_names = frozenset(role.name for role in user.roles if role.is_active)
     return any(role_name in user_role_names for role_name in role_names)
@@ -4,19 +4,61 @@ This module provides JWT-based authentication security configuration
 and user retrieval functions for the application.
 """
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from advanced_alchemy.exceptions import NotFoundError
+from cachetools import TTLCache
 from litestar.connection import ASGIConnection
 from litestar.exceptions import ClientException
 from litestar.security.jwt import OAuth2PasswordBearerAuth, Token
 
+from app.api.accounts.common import CacheGeneration
 from app.api.accounts.users.repositories import UserRepository
 from app.config import Settings
 from app.models.accounts import User
 
+from .permissions import load_user_access
+
+USER_CACHE_MAXSIZE = 10_000
+# The cache is per process: invalidations only reach the worker that handled the
+# change, so other workers may keep serving a user's previous access (including
+# revoked roles or a deactivated account) for up to this many seconds.
+USER_CACHE_TTL = 60
+
+# Authenticated users keyed by token subject, then by token expiration, so that a new
+# token for the same user never reuses an entry cached for a previous one and all of a
+# user's entries are dropped at once. A user's entries expire together, USER_CACHE_TTL
+# after the first of them was cached.
+_user_cache: TTLCache[str, dict[datetime, User]] = TTLCache(maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL)
+_user_cache_generation = CacheGeneration()
+
+
+def invalidate_user(user_id: UUID | str) -> None:
+    """Drop every cached entry for a user.
+
+    Must be called whenever the user's own data or role assignments change, after
+    the change has been committed (see :func:`app.db.run_after_commit`).
+
+    Args:
+        user_id: ID of the user whose cached entries should be removed
+
+    """
+    _user_cache_generation.value += 1
+    _user_cache.pop(str(user_id), None)
+
+
+def clear_user_cache() -> None:
+    """Drop all cached users.
+
+    Must be called whenever a change may affect the access of several users at
+    once, such as editing a role or a permission, after the change has been
+    committed (see :func:`app.db.run_after_commit`).
+    """
+    _user_cache_generation.value += 1
+    _user_cache.clear()
+
 
 async def current_user_from_token(
     token: Token,
@@ -25,24 +67,31 @@ async def current_user_from_token(
     """Retrieve the current user from a JWT token.
 
     Extracts the user ID from the token subject and fetches the corresponding
-    user from the database using the app's database configuration.
+    user from the database using the session factory bound at app creation. Users are
+    cached for a short time, so repeated requests with the same token skip the
+    database entirely.
 
     Args:
         token: JWT token containing user identification
-        connection: ASGI connection containing app state with database config
+        connection: ASGI connection containing app state with the session factory
 
     Returns:
-        User object for the authenticated user
+        User object for the authenticated user, with its access information
+        (permissions, role names and superuser flag) precomputed for the guards
 
     Raises:
         NotFoundException: If the user is not found in the database
 
     """
-    app_sqlalchemy_config = connection.app.state.sqlalchemy_config
-    async with app_sqlalchemy_config.get_session() as session:
+    cached_users = _user_cache.get(token.sub)
+    if cached_users is not None and (user := cached_users.get(token.exp)) is not None:
+        return user
+
+    generation = _user_cache_generation.value
+    async with connection.app.state.session_maker() as session:
         repo = UserRepository(session=session)
         try:
-            return await repo.get_one(id=UUID(token.sub))
+            user = await repo.get_one(id=UUID(token.sub))
         except NotFoundError as e:
             msg = "Token user not found"
             raise ClientException(msg) from e
@@ -50,6 +99,12 @@ async def current_user_from_token(
             msg = "Invalid user ID in token"
             raise ClientException(msg) from e
 
+    app_settings: Settings = connection.app.state.app_settings
+    load_user_access(user, app_settings.superuser_role_name)
+    if generation == _user_cache_generation.value:
+        _user_cache.setdefault(token.sub, {})[token.exp] = user
+    return user
+
 
 def create_oauth2_auth(app_settings: Settings) -> OAuth2PasswordBearerAuth[User]:
     """Create OAuth2 authentication configuration using provided settings."""
@@ -9,9 +9,16 @@ import datetime as dt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.accounts.users.repositories import UserRepository, provide_user_repository
-from app.api.accounts.users.services import password_hasher
+from app.api.accounts.users.services import password_hasher, verify_and_update_password
+from app.db import run_after_commit
 from app.models.accounts import User
 
+from .security import invalidate_user
+
+# Hash verified against when the username does not exist, so that unknown users
+# take as long to reject as wrong passwords.
+_DUMMY_HASH = password_hasher.hash("dummy-password")
+
 
 class AuthService:
     """Authentication service for business logic abstraction.
@@ -32,7 +39,10 @@ class AuthService:
         """Authenticate a user with username and password.
 
         Validates credentials and updates the last login timestamp on successful
-        authentication.
+        authentication. A password is always verified, against a dummy hash when the
+        username does not exist, and verification runs in the bounded Argon2 thread
+        pool so it does not block the event loop. Stored hashes created with
+        outdated parameters are replaced by a fresh hash of the valid password.
 
         Args:
             username: Username to authenticate
@@ -44,12 +54,19 @@ class AuthService:
         """
         user = await self.user_repository.get_one_or_none(username=username)
 
-        if not user or not password_hasher.verify(password, user.password):
+        password_hash = user.password if user else _DUMMY_HASH
+        password_valid, updated_hash = await verify_and_update_password(password, password_hash)
+        if not user or not password_valid:
             return None
 
+        if updated_hash is not None:
+            user.password = updated_hash
+
         # Update last login timestamp
         user.last_login = dt.datetime.now(dt.UTC)
-        return await self.user_repository.update(user)
+        user = await self.user_repository.update(user)
+        run_after_commit(self.user_repository.session, lambda: invalidate_user(user.id))
+        return user
 
 
 async def provide_auth_service(db_session: AsyncSession) -> AuthService:
@@ -0,0 +1,42 @@
+"""Helpers shared by the account controllers and services."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from advanced_alchemy.exceptions import NotFoundError
+from litestar import MediaType, Request, Response
+from msgspec import json
+
+
+def not_found_handler(detail: str) -> Callable[[Request[Any, Any, Any], NotFoundError], Response[Any]]:
+    """Create an exception handler returning a 404 response with a fixed detail.
+
+    The response body is encoded once when the handler is created.
+
+    Args:
+        detail: Message reported in the ``detail`` field (e.g., "Role not found")
+
+    Returns:
+        An exception handler for :class:`~advanced_alchemy.exceptions.NotFoundError`
+
+    """
+    body = json.encode({"status_code": 404, "detail": detail})
+
+    def handler(_: Request[Any, Any, Any], __: NotFoundError) -> Response[Any]:
+        """Return the pre-encoded 404 response."""
+        return Response(status_code=404, content=body, media_type=MediaType.JSON)
+
+    return handler
+
+
+@dataclass(slots=True)
+class CacheGeneration:
+    """Counter bumped whenever an in-process cache is invalidated.
+
+    A lookup that started before an invalidation may have read the previous state,
+    so callers record the value before loading and only cache the result if it is
+    unchanged afterwards.
+    """
+
+    value: int = 0
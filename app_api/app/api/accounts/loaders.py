@@ -0,0 +1,16 @@
+"""Relationship loader options shared by the account repositories.
+
+Each tuple mirrors the relationships serialized by the matching return DTO, so
+responses never trigger lazy loads. Update them together when a DTO starts or
+stops exposing a relationship.
+"""
+
+from sqlalchemy.orm import noload, selectinload
+
+from app.models.accounts import Role, User
+
+# RoleDTO exposes permissions but never the users holding the role
+ROLE_LOADER_OPTIONS = (selectinload(Role.permissions), noload(Role.users))
+
+# UserDTO exposes roles, and permission checks need their permissions
+USER_LOADER_OPTIONS = (selectinload(User.roles).selectinload(Role.permissions),)
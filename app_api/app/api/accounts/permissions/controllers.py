@@ -1,24 +1,22 @@
 """Permission management controller module."""
 
 from collections.abc import Sequence
-from typing import Any
 from uuid import UUID
 
 from advanced_alchemy.exceptions import NotFoundError
-from litestar import Controller, Request, Response, delete, get, patch, post
+from litestar import Controller, delete, get, patch, post
 from litestar.di import Provide
 from litestar.dto import DTOData
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.accounts.auth.guards import has_permission
+from app.api.accounts.auth.security import clear_user_cache
+from app.api.accounts.common import not_found_handler
+from app.db import run_after_commit
 from app.models.accounts import Permission
 
 from .dtos import PermissionCreateDTO, PermissionDTO, PermissionUpdateDTO
-from .services import PermissionService, provide_permission_service
-
-
-def not_found_error_handler(_: Request[Any, Any, Any], __: NotFoundError) -> Response[Any]:
-    """Handle permission not found errors by returning a 404 response."""
-    return Response(status_code=404, content={"status_code": 404, "detail": "Permission not found"})
+from .services import PermissionService, clear_permission_list_cache, provide_permission_service
 
 
 class PermissionController(Controller):
@@ -28,7 +26,7 @@ class PermissionController(Controller):
     tags = ("accounts / permissions",)
     return_dto = PermissionDTO
     dependencies = {"permission_service": Provide(provide_permission_service)}
-    exception_handlers = {NotFoundError: not_found_error_handler}
+    exception_handlers = {NotFoundError: not_found_handler("Permission not found")}
 
     @get(
         "/",
@@ -40,7 +38,7 @@ class PermissionController(Controller):
 
         This endpoint requires the 'permissions:list' permission.
         """
-        return await permission_service.list()
+        return await permission_service.list_all()
 
     @post(
         "/",
@@ -48,13 +46,20 @@ class PermissionController(Controller):
         dto=PermissionCreateDTO,
         guards=[has_permission("permissions", "create")],
     )
-    async def create(self, data: Permission, permission_service: PermissionService) -> Permission:
+    async def create(
+        self,
+        data: Permission,
+        permission_service: PermissionService,
+        db_session: AsyncSession,
+    ) -> Permission:
         """Create a new permission.
 
         Creates a new permission with the provided resource and action data.
         Requires the 'permissions:create' permission.
         """
-        return await permission_service.create(data)
+        permission = await permission_service.create(data)
+        run_after_commit(db_session, clear_permission_list_cache)
+        return permission
 
     @get(
         "/{permission_id:uuid}",
@@ -79,12 +84,16 @@ class PermissionController(Controller):
         permission_id: UUID,
         data: DTOData[Permission],
         permission_service: PermissionService,
+        db_session: AsyncSession,
     ) -> Permission:
         """Update an existing permission's data.
 
         Requires the 'permissions:update' permission.
         """
-        return await permission_service.update(item_id=permission_id, data=data.as_builtins())
+        permission = await permission_service.update(item_id=permission_id, data=data.as_builtins())
+        run_after_commit(db_session, clear_permission_list_cache)
+        run_after_commit(db_session, clear_user_cache)
+        return permission
 
     @delete(
         "/{permission_id:uuid}",
@@ -92,9 +101,16 @@ class PermissionController(Controller):
         status_code=204,
         guards=[has_permission("permissions", "delete")],
     )
-    async def delete(self, permission_id: UUID, permission_service: PermissionService) -> None:
+    async def delete(
+        self,
+        permission_id: UUID,
+        permission_service: PermissionService,
+        db_session: AsyncSession,
+    ) -> None:
         """Delete a permission from the system.
 
         Requires the 'permissions:delete' permission.
         """
         await permission_service.delete(permission_id)
+        run_after_commit(db_session, clear_permission_list_cache)
+        run_after_commit(db_session, clear_user_cache)
@@ -8,19 +8,21 @@ from app.models.accounts import Permission
 class PermissionDTO(SQLAlchemyDTO[Permission]):
     """DTO for reading permission data."""
 
-    config = SQLAlchemyDTOConfig(exclude={"roles"})
+    config = SQLAlchemyDTOConfig(exclude=frozenset({"roles"}))
 
 
 class PermissionCreateDTO(PermissionDTO):
     """DTO for creating permissions."""
 
-    config = SQLAlchemyDTOConfig(include={"name", "resource", "action", "description", "is_active"})
+    config = SQLAlchemyDTOConfig(
+        include=frozenset({"name", "resource", "action", "description", "is_active"})
+    )
 
 
 class PermissionUpdateDTO(PermissionDTO):
     """DTO for updating permissions."""
 
     config = SQLAlchemyDTOConfig(
-        include={"name", "resource", "action", "description", "is_active"},
+        include=frozenset({"name", "resource", "action", "description", "is_active"}),
         partial=True,
     )
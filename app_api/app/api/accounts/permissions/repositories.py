@@ -1,7 +1,11 @@
 """Permission repository module."""
 
+from collections.abc import Sequence
+from uuid import UUID
+
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.accounts import Permission
@@ -12,6 +16,25 @@ class PermissionRepository(SQLAlchemyAsyncRepository[Permission]):
 
     model_type = Permission
 
+    async def list_by_ids(self, permission_ids: Sequence[UUID]) -> Sequence[Permission]:
+        """Fetch the permissions matching a set of identifiers.
+
+        On PostgreSQL the identifiers are sent as a single ``uuid[]`` parameter
+        (``id = ANY($1)``), so the statement is the same for any number of IDs.
+        Other dialects use a regular ``IN`` clause.
+
+        Args:
+            permission_ids: UUIDs to resolve.
+
+        Returns:
+            The matching permissions.
+
+        """
+        if self._dialect.name == "postgresql":
+            ids = bindparam("permission_ids", list(permission_ids), type_=ARRAY(Permission.id.type))
+            return await self.list(Permission.id == any_(ids))
+        return await self.list(Permission.id.in_(permission_ids))
+
 
 async def provide_permission_repository(db_session: AsyncSession) -> PermissionRepository:
     """Dependency injection provider for permission repository."""
@@ -3,13 +3,32 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from advanced_alchemy.filters import CollectionFilter
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.accounts.common import CacheGeneration
 from app.api.accounts.permissions.repositories import PermissionRepository
 from app.models.accounts import Permission
 
+PERMISSION_LIST_CACHE_TTL = 30
+
+_ALL_PERMISSIONS_KEY = "all"
+_permission_list_cache: TTLCache[str, Sequence[Permission]] = TTLCache(
+    maxsize=1, ttl=PERMISSION_LIST_CACHE_TTL
+)
+_permission_list_generation = CacheGeneration()
+
+
+def clear_permission_list_cache() -> None:
+    """Drop the cached permission list.
+
+    Must be called whenever a permission is created, updated or deleted, after the
+    change has been committed (see :func:`app.db.run_after_commit`).
+    """
+    _permission_list_generation.value += 1
+    _permission_list_cache.clear()
+
 
 class PermissionService(SQLAlchemyAsyncRepositoryService[Permission, PermissionRepository]):
     """Business logic wrapper for permission operations."""
@@ -17,18 +36,36 @@ class PermissionService(SQLAlchemyAsyncRepositoryService[Permission, PermissionR
     repository_type = PermissionRepository
     match_fields = ["id", "name"]
 
-    async def list_by_ids(self, permission_ids: list[UUID | str]) -> Sequence[Permission]:
+    async def list_all(self) -> Sequence[Permission]:
+        """List all permissions, served from a short-lived in-process cache.
+
+        Permissions change rarely, so the full list is kept for a few seconds
+        instead of being queried on every call.
+
+        Returns:
+            All :class:`~app.models.accounts.Permission` records, ordered by name.
+
+        """
+        permissions = _permission_list_cache.get(_ALL_PERMISSIONS_KEY)
+        if permissions is None:
+            generation = _permission_list_generation.value
+            permissions = await self.list(order_by=Permission.name.asc())
+            if generation == _permission_list_generation.value:
+                _permission_list_cache[_ALL_PERMISSIONS_KEY] = permissions
+        return permissions
+
+    async def list_by_ids(self, permission_ids: Sequence[UUID]) -> Sequence[Permission]:
         """Fetch a set of permissions by identifier.
 
         Args:
-            permission_ids: Collection of UUIDs (or string UUIDs) to resolve.
+            permission_ids: Collection of UUIDs to resolve.
 
         Returns:
-            Ordered list of :class:`~app.models.accounts.Permission` records that
-            match the provided identifiers.
+            The :class:`~app.models.accounts.Permission` records that match the
+            provided identifiers, in no particular order.
 
         """
-        return await self.list(CollectionFilter(field_name="id", values=permission_ids))
+        return await self.repository.list_by_ids(permission_ids)
 
 
 async def provide_permission_service(db_session: AsyncSession) -> PermissionService:
@@ -1,27 +1,25 @@
 """Role management controller module."""
 
 from collections.abc import Sequence
-from typing import Any
 from uuid import UUID
 
 from advanced_alchemy.exceptions import NotFoundError
-from litestar import Controller, Request, Response, get, patch, post
+from litestar import Controller, get, patch, post
 from litestar.di import Provide
 from litestar.dto import DTOData
 from litestar.exceptions import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.accounts.auth.guards import has_permission
+from app.api.accounts.auth.security import clear_user_cache
+from app.api.accounts.common import not_found_handler
+from app.db import run_after_commit
 from app.models.accounts import Role
 
 from .dtos import RoleCreateDTO, RoleDTO, RoleUpdateDTO
 from .services import RoleService, provide_role_service
 
 
-def not_found_error_handler(_: Request[Any, Any, Any], __: NotFoundError) -> Response[Any]:
-    """Handle role not found errors by returning a 404 response."""
-    return Response(status_code=404, content={"status_code": 404, "detail": "Role not found"})
-
-
 class RoleController(Controller):
     """Role management controller for CRUD operations.
 
@@ -33,7 +31,7 @@ class RoleController(Controller):
     tags = ("accounts / roles",)
     return_dto = RoleDTO
     dependencies = {"role_service": Provide(provide_role_service)}
-    exception_handlers = {NotFoundError: not_found_error_handler}
+    exception_handlers = {NotFoundError: not_found_handler("Role not found")}
 
     @get(
         "/",
@@ -64,6 +62,23 @@ class RoleController(Controller):
         except ValueError as exc:
             raise HTTPException(detail=str(exc), status_code=400) from exc
 
+    @post(
+        "/batch",
+        summary="CreateRoles",
+        dto=RoleCreateDTO,
+        guards=[has_permission("roles", "create")],
+    )
+    async def create_many(self, data: list[Role], role_service: RoleService) -> Sequence[Role]:
+        """Create several roles with their associated permissions at once.
+
+        The permissions of all roles are validated together and the roles are
+        inserted in a single transaction. Requires the 'roles:create' permission.
+        """
+        try:
+            return await role_service.create_roles_with_permissions(data)
+        except ValueError as exc:
+            raise HTTPException(detail=str(exc), status_code=400) from exc
+
     @get(
         "/{role_id:uuid}",
         summary="FetchRole",
@@ -82,13 +97,22 @@ class RoleController(Controller):
         dto=RoleUpdateDTO,
         guards=[has_permission("roles", "update")],
     )
-    async def update(self, role_id: UUID, data: DTOData[Role], role_service: RoleService) -> Role:
+    async def update(
+        self,
+        role_id: UUID,
+        data: DTOData[Role],
+        role_service: RoleService,
+        db_session: AsyncSession,
+    ) -> Role:
         """Update an existing role's data and permissions.
 
         Updates the specified role's information and permission assignments
         with the provided data. Requires the 'roles:update' permission.
         """
         try:
-            return await role_service.update_role_with_permissions(role_id, data.as_builtins())
+            role = await role_service.update_role_with_permissions(role_id, data.as_builtins())
         except ValueError as exc:
             raise HTTPException(detail=str(exc), status_code=400) from exc
+
+        run_after_commit(db_session, clear_user_cache)
+        return role
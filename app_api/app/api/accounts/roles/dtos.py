@@ -12,19 +12,19 @@ from app.models.accounts import Role
 class RoleDTO(SQLAlchemyDTO[Role]):
     """Base role DTO."""
 
-    config = SQLAlchemyDTOConfig(exclude={"users", "permissions.0.roles"})
+    config = SQLAlchemyDTOConfig(exclude=frozenset({"users", "permissions.0.roles"}))
 
 
 class RoleCreateDTO(RoleDTO):
     """DTO for role creation."""
 
-    config = SQLAlchemyDTOConfig(include={"name", "description", "permissions.0.id"})
+    config = SQLAlchemyDTOConfig(include=frozenset({"name", "description", "permissions.0.id"}))
 
 
 class RoleUpdateDTO(RoleDTO):
     """DTO for role updates."""
 
     config = SQLAlchemyDTOConfig(
-        include={"name", "description", "is_active", "permissions.0.id"},
+        include=frozenset({"name", "description", "is_active", "permissions.0.id"}),
         partial=True,
     )
@@ -4,10 +4,14 @@ This module provides data access layer functionality for role management,
 including database operations and dependency injection providers.
 """
 
+from typing import Any
+
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.accounts.loaders import ROLE_LOADER_OPTIONS
+from app.db import with_strict_loading
 from app.models.accounts import Role
 
 
@@ -15,9 +19,21 @@ class RoleRepository(SQLAlchemyAsyncRepository[Role]):
     """Repository for role data access operations.
 
     Provides CRUD operations for Role entities using SQLAlchemy async repository.
+    Permissions are always eagerly loaded, since every role response includes them.
     """
 
     model_type = Role
+    loader_options = ROLE_LOADER_OPTIONS
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the repository, enabling strict loading if configured on the session.
+
+        Args:
+            **kwargs: Arguments to pass to the base repository.
+
+        """
+        kwargs.setdefault("load", with_strict_loading(kwargs["session"], self.loader_options))
+        super().__init__(**kwargs)
 
 
 async def provide_role_repository(db_session: AsyncSession) -> RoleRepository:
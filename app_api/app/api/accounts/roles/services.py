@@ -1,5 +1,7 @@
 """Role service module for business logic and data access."""
 
+from collections.abc import Sequence
+from itertools import chain
 from typing import Any
 from uuid import UUID
 
@@ -17,44 +19,22 @@ class RoleService(SQLAlchemyAsyncRepositoryService[Role, RoleRepository]):
     repository_type = RoleRepository
     match_fields = "id"
 
-    def __init__(self, **repo_kwargs: Any) -> None:  # noqa: ANN401
+    def __init__(self, *, permission_service: PermissionService, **repo_kwargs: Any) -> None:  # noqa: ANN401
         """Initialize role service with repository configuration.
 
         Args:
+            permission_service: Service used to resolve permission identifiers.
             **repo_kwargs: Arguments to pass to the repository.
 
         """
         super().__init__(**repo_kwargs)
-        self.permission_service: PermissionService | None = None
-
-    def set_permission_service(self, permission_service: PermissionService) -> None:
-        """Inject the permission service dependency.
-
-        Args:
-            permission_service: Service used to resolve permission identifiers.
-
-        """
         self.permission_service = permission_service
 
-    async def assign_permissions(self, role: Role, permissions: list[dict[str, Any]]) -> Role:
-        """Replace the role's permissions with the validated collection.
-
-        Args:
-            role: Role to mutate.
-            permissions: Permission payloads with identifiers.
-
-        Returns:
-            ``role`` with ``permissions`` refreshed to match the IDs provided.
-
-        """
-        role.permissions = await self._validate_and_get_permissions(permissions)
-        return role
-
     async def create_role_with_permissions(self, data: Role) -> Role:
         """Create a new role with validated permissions.
 
-        Normalizes permission data, creates the role, and assigns permissions
-        in a single transaction.
+        Permissions are resolved before the role is created, so the role and its
+        permission assignments are inserted in a single flush.
 
         Args:
             data: Role data including permissions list.
@@ -66,26 +46,50 @@ class RoleService(SQLAlchemyAsyncRepositoryService[Role, RoleRepository]):
             ValueError: If permission validation fails.
 
         """
-        raw_permissions = getattr(data, "permissions", None) or []
+        raw_permissions = getattr(data, "permissions", None)
+        if not raw_permissions:
+            data.permissions = []
+            return await self.create(data)
+
         permissions_payload = self._normalize_permissions(raw_permissions)
+        data.permissions = await self._validate_and_get_permissions(permissions_payload)
 
-        # Clear permissions to avoid unintended inserts during role creation
-        data.permissions = []
+        return await self.create(data)
 
-        # Create the role first
-        role = await self.create(data)
+    async def create_roles_with_permissions(self, data: list[Role]) -> Sequence[Role]:
+        """Create several roles with validated permissions.
 
-        # Assign permissions if provided
-        if permissions_payload:
-            role = await self.assign_permissions(role, permissions_payload)
+        The permissions requested by all roles are resolved with a single query
+        and the roles are inserted together.
+
+        Args:
+            data: Role data including permissions lists.
+
+        Returns:
+            Created roles with assigned permissions, in request order.
+
+        Raises:
+            ValueError: If permission validation fails.
 
-        return role
+        """
+        permission_payloads = [
+            self._normalize_permissions(getattr(role, "permissions", None) or []) for role in data
+        ]
+        permissions = await self._validate_and_get_permissions(list(chain.from_iterable(permission_payloads)))
+        permissions_by_id = {permission.id: permission for permission in permissions}
+
+        for role, payload in zip(data, permission_payloads, strict=True):
+            role.permissions = [
+                permissions_by_id[permission_id] for permission_id in self._permission_ids(payload)
+            ]
+
+        return await self.create_many(data)
 
     async def update_role_with_permissions(self, role_id: UUID, data: dict[str, Any]) -> Role:
         """Update a role with optional permission reassignment.
 
-        Extracts permission data from update payload, updates role attributes,
-        and optionally replaces the role's permissions.
+        When permissions are provided they are resolved first and applied together
+        with the role attributes, so the update happens in a single flush.
 
         Args:
             role_id: UUID of the role to update.
@@ -99,23 +103,25 @@ class RoleService(SQLAlchemyAsyncRepositoryService[Role, RoleRepository]):
 
         """
         permissions_payload = data.pop("permissions", None)
-
-        # Update base role attributes
-        updated_role = await self.update(item_id=role_id, data=data)
-
-        # Update permissions if provided
-        if permissions_payload is not None:
+        if permissions_payload:
             normalized_permissions = self._normalize_permissions(permissions_payload)
-            updated_role = await self.assign_permissions(updated_role, normalized_permissions)
+            data["permissions"] = await self._validate_and_get_permissions(normalized_permissions)
+        elif permissions_payload is not None:
+            data["permissions"] = []
+
+        role = await self.get(role_id)
+        for key, value in data.items():
+            setattr(role, key, value)
 
-        return updated_role
+        return await self.update(role)
 
     @staticmethod
     def _normalize_permissions(raw_permissions: list[Any]) -> list[dict[str, Any]]:
         """Normalize permission payloads from various formats.
 
         Handles both dict and object formats for permission data, extracting
-        the ID field regardless of input structure.
+        the ID field regardless of input structure. Each item is inspected on its
+        own, and items without an ID are skipped.
 
         Args:
             raw_permissions: List of permissions in various formats (objects or dicts).
@@ -124,18 +130,40 @@ class RoleService(SQLAlchemyAsyncRepositoryService[Role, RoleRepository]):
             List of normalized permission dicts with ``id`` keys.
 
         """
-        normalized_permissions: list[dict[str, Any]] = []
+        return [
+            {"id": permission_id}
+            for permission in raw_permissions
+            if (permission_id := RoleService._permission_id(permission)) is not None
+        ]
 
-        for permission in raw_permissions:
-            if isinstance(permission, dict):
-                permission_id = permission.get("id")
-            else:
-                permission_id = getattr(permission, "id", None)
+    @staticmethod
+    def _permission_id(permission: Any) -> Any:  # noqa: ANN401
+        """Get the ID of a permission payload given as a dict or an object, or None if it has none."""
+        if isinstance(permission, dict):
+            return permission.get("id")
+        return getattr(permission, "id", None)
 
-            if permission_id is not None:
-                normalized_permissions.append({"id": permission_id})
+    @staticmethod
+    def _permission_ids(permissions: list[dict[str, Any]]) -> list[UUID]:
+        """Extract the unique permission IDs of normalized payloads as UUIDs.
 
-        return normalized_permissions
+        Args:
+            permissions: Sequence of dict payloads containing an ``id``.
+
+        Returns:
+            The IDs in request order, without duplicates.
+
+        Raises:
+            ValueError: If an ID is not a valid UUID.
+
+        """
+        return list(
+            dict.fromkeys(
+                permission_id if isinstance(permission_id, UUID) else UUID(str(permission_id))
+                for permission in permissions
+                if (permission_id := permission.get("id")) is not None
+            ),
+        )
 
     async def _validate_and_get_permissions(self, permissions: list[dict[str, Any]]) -> list[Permission]:
         """Validate provided permission payloads and return ORM instances.
@@ -147,28 +175,20 @@ class RoleService(SQLAlchemyAsyncRepositoryService[Role, RoleRepository]):
             List of :class:`app.models.accounts.Permission` resolved from the IDs.
 
         Raises:
-            ValueError: If the dependency is missing or an ID is unknown.
+            ValueError: If an ID is unknown or is not a valid UUID.
 
         """
-        if not self.permission_service:
-            msg = "Permission service not configured"
-            raise ValueError(msg)
-
-        permission_ids: list[UUID | str] = [
-            permission["id"] for permission in permissions if "id" in permission
-        ]
+        permission_ids = self._permission_ids(permissions)
         if len(permission_ids) == 0:
             return []
 
         validated_permissions = await self.permission_service.list_by_ids(permission_ids)
 
         # Identify invalid permission and raise error if any
-        resolved_ids = {str(permission.id) for permission in validated_permissions}
-        missing_ids = [
-            str(permission_id) for permission_id in permission_ids if str(permission_id) not in resolved_ids
-        ]
+        resolved_ids = {permission.id for permission in validated_permissions}
+        missing_ids = [permission_id for permission_id in permission_ids if permission_id not in resolved_ids]
         if missing_ids:
-            missing = ", ".join(missing_ids)
+            missing = ", ".join(map(str, missing_ids))
             msg = f"Unknown permission identifiers: {missing}"
             raise ValueError(msg)
 
@@ -185,7 +205,4 @@ async def provide_role_service(db_session: AsyncSession) -> RoleService:
         :class:`RoleService` wired with a :class:`PermissionService`.
 
     """
-    role_service = RoleService(session=db_session)
-    permission_service = PermissionService(session=db_session)
-    role_service.set_permission_service(permission_service)
-    return role_service
+    return RoleService(session=db_session, permission_service=PermissionService(session=db_session))
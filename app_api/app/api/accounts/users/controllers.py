@@ -5,13 +5,16 @@ from typing import Any
 from uuid import UUID
 
 from advanced_alchemy.exceptions import NotFoundError
-from litestar import Controller, Request, Response, delete, get, patch, post
+from litestar import Controller, Request, delete, get, patch, post
 from litestar.di import Provide
 from litestar.dto import DTOData
 from litestar.exceptions import HTTPException
 from litestar.security.jwt import Token
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.accounts.auth.guards import has_permission
+from app.api.accounts.auth.security import invalidate_user
+from app.api.accounts.common import not_found_handler
 from app.api.accounts.users.dtos import (
     PasswordChange,
     PasswordChangeDTO,
@@ -22,14 +25,10 @@ from app.api.accounts.users.dtos import (
     UserWriteDTO,
 )
 from app.api.accounts.users.services import UserService, provide_user_service
+from app.db import run_after_commit
 from app.models.accounts import User
 
 
-def not_found_error_handler(_: Request[Any, Any, Any], __: NotFoundError) -> Response[Any]:
-    """Handle user not found errors by returning a 404 response."""
-    return Response(status_code=404, content={"status_code": 404, "detail": "User not found"})
-
-
 class UserController(Controller):
     """User management controller for comprehensive user operations.
 
@@ -41,7 +40,7 @@ class UserController(Controller):
     tags = ("accounts / users",)
     return_dto = UserDTO
     dependencies = {"user_service": Provide(provide_user_service)}
-    exception_handlers = {NotFoundError: not_found_error_handler}
+    exception_handlers = {NotFoundError: not_found_handler("User not found")}
 
     @get(
         "/",
@@ -72,6 +71,23 @@ class UserController(Controller):
         except ValueError as e:
             raise HTTPException(detail=str(e), status_code=409) from e
 
+    @post(
+        "/batch",
+        summary="CreateUsers",
+        dto=UserWriteDTO,
+        guards=[has_permission("users", "create")],
+    )
+    async def create_many(self, data: list[User], user_service: UserService) -> Sequence[User]:
+        """Create several users with their associated roles at once.
+
+        The roles of all users are resolved together and the users are inserted
+        in a single transaction. Requires the 'users:create' permission.
+        """
+        try:
+            return await user_service.create_users_with_roles(data)
+        except ValueError as e:
+            raise HTTPException(detail=str(e), status_code=409) from e
+
     @get("/me", summary="FetchMyUser")
     async def fetch_me(self, request: Request[User, Token, Any]) -> User:
         """Fetch the currently authenticated user's profile.
@@ -112,23 +128,33 @@ class UserController(Controller):
         dto=UserUpdateDTO,
         guards=[has_permission("users", "update")],
     )
-    async def update(self, user_id: UUID, data: DTOData[User], user_service: UserService) -> User:
+    async def update(
+        self,
+        user_id: UUID,
+        data: DTOData[User],
+        user_service: UserService,
+        db_session: AsyncSession,
+    ) -> User:
         """Update an existing user's profile and roles.
 
         Updates the specified user's profile information and role assignments
         with the provided data. Requires the 'users:update' permission.
         """
         try:
-            return await user_service.update_user_with_roles(user_id, data)
+            user = await user_service.update_user_with_roles(user_id, data)
         except ValueError as e:
             raise HTTPException(detail=str(e), status_code=400) from e
 
+        run_after_commit(db_session, lambda: invalidate_user(user_id))
+        return user
+
     @post("/me/update-password", summary="UpdateMyPassword", dto=PasswordChangeDTO, status_code=204)
     async def update_my_password(
         self,
         data: DTOData[PasswordChange],
         request: Request[User, Token, Any],
         user_service: UserService,
+        db_session: AsyncSession,
     ) -> None:
         """Update the authenticated user's password.
 
@@ -143,6 +169,8 @@ class UserController(Controller):
         except ValueError as e:
             raise HTTPException(detail=str(e), status_code=422) from e
 
+        run_after_commit(db_session, lambda: invalidate_user(user.id))
+
     @get("/username-available", summary="CheckUsernameAvailable", return_dto=UsernameAvailableDTO)
     async def username_available(self, username: str, user_service: UserService) -> UsernameAvailable:
         """Check if a username is available for registration."""
@@ -153,9 +181,10 @@ class UserController(Controller):
         summary="DeleteUser",
         guards=[has_permission("users", "delete")],
     )
-    async def delete(self, user_id: UUID, user_service: UserService) -> None:
+    async def delete(self, user_id: UUID, user_service: UserService, db_session: AsyncSession) -> None:
         """Delete a user account from the system.
 
         Requires the 'users:delete' permission.
         """
         await user_service.delete(user_id)
+        run_after_commit(db_session, lambda: invalidate_user(user_id))
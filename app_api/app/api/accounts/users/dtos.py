@@ -16,20 +16,22 @@ from app.models.accounts import User
 class UserDTO(SQLAlchemyDTO[User]):
     """DTO for reading user data."""
 
-    config = SQLAlchemyDTOConfig(exclude={"password", "roles.0.created_at", "roles.0.updated_at"})
+    config = SQLAlchemyDTOConfig(exclude=frozenset({"password", "roles.0.created_at", "roles.0.updated_at"}))
 
 
 class UserWriteDTO(SQLAlchemyDTO[User]):
     """DTO for creating users."""
 
-    config = SQLAlchemyDTOConfig(include={"username", "email", "fullname", "password", "roles.0.id"})
+    config = SQLAlchemyDTOConfig(
+        include=frozenset({"username", "email", "fullname", "password", "roles.0.id"})
+    )
 
 
 class UserUpdateDTO(SQLAlchemyDTO[User]):
     """DTO for updating users."""
 
     config = SQLAlchemyDTOConfig(
-        include={"username", "email", "fullname", "password", "is_active", "roles.0.id"},
+        include=frozenset({"username", "email", "fullname", "password", "is_active", "roles.0.id"}),
         partial=True,
     )
 
@@ -4,10 +4,14 @@ This module provides basic data access layer functionality for user management.
 Business logic has been moved to the service layer.
 """
 
+from typing import Any
+
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
-from sqlalchemy import select
+from sqlalchemy import literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.accounts.loaders import USER_LOADER_OPTIONS
+from app.db import with_strict_loading
 from app.models.accounts import User
 
 
@@ -15,13 +19,29 @@ class UserRepository(SQLAlchemyAsyncRepository[User]):
     """Repository for user data access operations.
 
     Provides basic CRUD operations. Business logic is handled by UserService.
+    Roles and their permissions are always eagerly loaded, since user responses
+    and permission checks need them.
     """
 
     model_type = User
+    loader_options = USER_LOADER_OPTIONS
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the repository, enabling strict loading if configured on the session.
+
+        Args:
+            **kwargs: Arguments to pass to the base repository.
+
+        """
+        kwargs.setdefault("load", with_strict_loading(kwargs["session"], self.loader_options))
+        super().__init__(**kwargs)
 
     async def username_exists(self, username: str) -> bool:
         """Check if a username is already in use.
 
+        Runs a ``SELECT 1 ... LIMIT 1`` probe on the username index instead of
+        counting matching rows.
+
         Args:
             username: Username to check for availability
 
@@ -29,7 +49,8 @@ class UserRepository(SQLAlchemyAsyncRepository[User]):
             True if username exists, False otherwise
 
         """
-        return await self.exists(username=username)
+        statement = select(literal(1)).where(User.username == username).limit(1)
+        return await self.session.scalar(statement) is not None
 
 
 async def provide_user_repository(db_session: AsyncSession) -> UserRepository:
@@ -4,6 +4,10 @@ This module provides business logic abstraction, data transformation,
 and validation for user management operations.
 """
 
+import asyncio
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from uuid import UUID
 
@@ -12,14 +16,98 @@ from advanced_alchemy.filters import CollectionFilter
 from advanced_alchemy.service import SQLAlchemyAsyncRepositoryService
 from litestar.dto import DTOData
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.accounts.permissions.services import PermissionService
 from app.api.accounts.roles.services import RoleService
 from app.api.accounts.users.dtos import PasswordChange, UsernameAvailable
 from app.api.accounts.users.repositories import UserRepository
+from app.config import settings
 from app.models.accounts import Role, User
 
-password_hasher = PasswordHash.recommended()
+# Argon2id with the configured parameters (by default the OWASP recommendation: 46 MiB,
+# 1 iteration, 1 lane). Hashes created with other parameters are upgraded on the next
+# successful login.
+password_hasher = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=settings.argon2_time_cost,
+            memory_cost=settings.argon2_memory_cost,
+            parallelism=settings.argon2_parallelism,
+        ),
+    ),
+)
+
+
+def _argon2_max_workers() -> int:
+    """Size the Argon2 pool so concurrent hashes fit in CPU count and physical memory.
+
+    Returns:
+        The number of worker threads for the Argon2 executor
+
+    """
+    cpu_count = os.cpu_count() or 1
+    if not hasattr(os, "sysconf"):
+        return cpu_count
+    try:
+        total_memory_kib = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 1024
+    except ValueError:
+        return cpu_count
+    return max(1, min(cpu_count, total_memory_kib // settings.argon2_memory_cost))
+
+
+_argon2_executor = ThreadPoolExecutor(max_workers=_argon2_max_workers(), thread_name_prefix="argon2")
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password in the bounded Argon2 thread pool.
+
+    Args:
+        password: Plain text password to hash
+
+    Returns:
+        The Argon2 hash of the password
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_argon2_executor, password_hasher.hash, password)
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    """Verify a password in the bounded Argon2 thread pool.
+
+    Args:
+        password: Plain text password to verify
+        password_hash: Stored hash to verify against
+
+    Returns:
+        True if the password matches the hash, False otherwise
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_argon2_executor, password_hasher.verify, password, password_hash)
+
+
+async def verify_and_update_password(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """Verify a password in the bounded Argon2 thread pool, rehashing it if outdated.
+
+    Args:
+        password: Plain text password to verify
+        password_hash: Stored hash to verify against
+
+    Returns:
+        Whether the password matches, and a new hash if the stored one uses
+        outdated parameters
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _argon2_executor,
+        password_hasher.verify_and_update,
+        password,
+        password_hash,
+    )
 
 
 class UserService(SQLAlchemyAsyncRepositoryService[User, UserRepository]):
@@ -32,23 +120,15 @@ class UserService(SQLAlchemyAsyncRepositoryService[User, UserRepository]):
     repository_type = UserRepository
     match_fields = "id"
 
-    def __init__(self, **repo_kwargs: Any) -> None:  # noqa: ANN401
+    def __init__(self, *, role_service: RoleService, **repo_kwargs: Any) -> None:  # noqa: ANN401
         """Initialize user service with repository configuration.
 
         Args:
+            role_service: Service used to resolve role identifiers.
             **repo_kwargs: Arguments to pass to the repository.
 
         """
         super().__init__(**repo_kwargs)
-        self.role_service: RoleService | None = None
-
-    def set_role_service(self, role_service: RoleService) -> None:
-        """Set the role service dependency.
-
-        Args:
-            role_service: Service used to resolve role identifiers.
-
-        """
         self.role_service = role_service
 
     async def create_user_with_roles(self, data: User) -> User:
@@ -65,21 +145,47 @@ class UserService(SQLAlchemyAsyncRepositoryService[User, UserRepository]):
             DuplicateKeyError: If username/email already exists
 
         """
-        user = User(**data.to_dict())
-
-        if hasattr(data, "password"):
-            user.password = password_hasher.hash(data.password)
+        # The decoded payload is already a transient User; its roles are only id
+        # placeholders, so they are swapped for the persisted roles before insert.
+        data.roles = await self._validate_and_get_roles([role.id for role in data.roles])
+        data.password = await hash_password(data.password)
 
         try:
-            user = await self.create(user)
-            if hasattr(data, "roles"):
-                user.roles = await self._validate_and_get_roles([role.to_dict() for role in data.roles])
+            return await self.create(data)
+        except DuplicateKeyError as e:
+            msg = "Username or email already in use"
+            raise ValueError(msg) from e
+
+    async def create_users_with_roles(self, data: list[User]) -> Sequence[User]:
+        """Create several users with role validation and password hashing.
+
+        The roles requested by all users are resolved with a single query, the
+        passwords are hashed concurrently in the Argon2 thread pool and the users
+        are inserted together.
 
+        Args:
+            data: User data including roles and password for each user
+
+        Returns:
+            Created users with assigned roles, in request order
+
+        Raises:
+            ValueError: If a username or email is already in use
+
+        """
+        roles = await self._validate_and_get_roles([role.id for user in data for role in user.roles])
+        roles_by_id = {role.id: role for role in roles}
+        password_hashes = await asyncio.gather(*(hash_password(user.password) for user in data))
+
+        for user, password_hash in zip(data, password_hashes, strict=True):
+            user.password = password_hash
+            user.roles = [roles_by_id[role.id] for role in user.roles if role.id in roles_by_id]
+
+        try:
+            return await self.create_many(data)
         except DuplicateKeyError as e:
             msg = "Username or email already in use"
             raise ValueError(msg) from e
-        else:
-            return user
 
     async def update_user_with_roles(self, user_id: UUID, data: DTOData[User]) -> User:
         """Update user with role validation and optional password hashing.
@@ -96,12 +202,12 @@ class UserService(SQLAlchemyAsyncRepositoryService[User, UserRepository]):
         roles_data = data_dict.pop("roles", None)
 
         if "password" in data_dict:
-            data_dict["password"] = password_hasher.hash(data_dict["password"])
+            data_dict["password"] = await hash_password(data_dict["password"])
 
         updated_user = await self.update(data=data_dict, item_id=user_id)
 
         if roles_data is not None:
-            updated_user.roles = await self._validate_and_get_roles([role.to_dict() for role in roles_data])
+            updated_user.roles = await self._validate_and_get_roles([role.id for role in roles_data])
 
         return updated_user
 
@@ -122,11 +228,11 @@ class UserService(SQLAlchemyAsyncRepositoryService[User, UserRepository]):
 
         # Get user and verify current password
         user = await self.get(user_id)
-        if not password_hasher.verify(current_password, user.password):
+        if not await verify_password(current_password, user.password):
             msg = "Invalid current password"
             raise ValueError(msg)
 
-        password_update = {"password": password_hasher.hash(new_password)}
+        password_update = {"password": await hash_password(new_password)}
         await self.update(item_id=user_id, data=password_update)
 
     async def check_username_availability(self, username: str) -> UsernameAvailable:
@@ -142,28 +248,19 @@ class UserService(SQLAlchemyAsyncRepositoryService[User, UserRepository]):
         exists = await self.repository.username_exists(username)
         return UsernameAvailable(username=username, available=not exists)
 
-    async def _validate_and_get_roles(self, roles: list[dict[str, Any]]) -> list[Role]:
+    async def _validate_and_get_roles(self, role_ids: Sequence[UUID]) -> list[Role]:
         """Validate role existence and return role objects.
 
         Args:
-            roles: List of role objects or IDs to validate
+            role_ids: IDs of the roles to validate
 
         Returns:
             List of validated role objects
 
-        Raises:
-            ValueError: If role service not configured
-
         """
-        if not self.role_service:
-            msg = "Role service not configured"
-            raise ValueError(msg)
-
-        if not roles:
+        if not role_ids:
             return []
 
-        role_ids = [role["id"] for role in roles]
-
         validated_roles = await self.role_service.list(CollectionFilter(field_name="id", values=role_ids))
 
         return list(validated_roles)
@@ -179,7 +276,5 @@ async def provide_user_service(db_session: AsyncSession) -> UserService:
         :class:`UserService` wired with a :class:`RoleService`.
 
     """
-    user_service = UserService(session=db_session)
-    role_service = RoleService(session=db_session)
-    user_service.set_role_service(role_service)
-    return user_service
+    role_service = RoleService(session=db_session, permission_service=PermissionService(session=db_session))
+    return UserService(session=db_session, role_service=role_service)
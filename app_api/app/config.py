@@ -33,6 +33,16 @@ class Settings(BaseSettings):
     cors_allowed_origins: list[str] = ["http://localhost:3000"]
     superuser_role_name: str = "admin"
 
+    # Connection pool per process: up to db_pool_size + db_max_overflow connections
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 10  # seconds to wait for a free connection
+
+    # Argon2id parameters for password hashes; defaults follow the OWASP recommendation
+    argon2_time_cost: int = 1
+    argon2_memory_cost: int = 47_104  # KiB
+    argon2_parallelism: int = 1
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -4,6 +4,8 @@ This module sets up the SQLAlchemy database configuration and plugin
 for the Litestar application using async SQLAlchemy support.
 """
 
+from collections.abc import Callable, Sequence
+
 from advanced_alchemy.config import AsyncSessionConfig
 from advanced_alchemy.extensions.litestar import (
     AlembicAsyncConfig,
@@ -11,9 +13,20 @@ from advanced_alchemy.extensions.litestar import (
     SQLAlchemyAsyncConfig,
     SQLAlchemyPlugin,
 )
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.config import Settings, settings
 
+STRICT_LOADING_KEY = "strict_loading"
+
+# Server settings for asyncpg connections: JIT compilation only pays off for long analytical
+# queries and adds planning latency to the short queries issued by the API.
+ASYNCPG_SERVER_SETTINGS = {"jit": "off", "application_name": "app_api"}
+POOL_RECYCLE_SECONDS = 1800
+
 
 def create_sqlalchemy_config(
     app_settings: Settings | None = None,
@@ -24,8 +37,8 @@ def create_sqlalchemy_config(
 
     Args:
         app_settings: Settings instance to use. If None, uses global settings.
-        pool_size: Size of the connection pool. If None, uses SQLAlchemy default.
-        max_overflow: Maximum overflow size. If None, uses SQLAlchemy default.
+        pool_size: Size of the connection pool. If None, uses the configured ``db_pool_size``.
+        max_overflow: Maximum overflow size. If None, uses the configured ``db_max_overflow``.
 
     Returns:
         SQLAlchemy async configuration instance
@@ -34,16 +47,24 @@ def create_sqlalchemy_config(
     if app_settings is None:
         app_settings = settings
 
-    engine_config_kwargs: dict = {"echo": False}
-    if pool_size is not None:
-        engine_config_kwargs["pool_size"] = pool_size
-    if max_overflow is not None:
-        engine_config_kwargs["max_overflow"] = max_overflow
+    connection_string = app_settings.database_url.unicode_string()
+    engine_config_kwargs: dict = {
+        "echo": False,
+        "pool_size": pool_size if pool_size is not None else app_settings.db_pool_size,
+        "max_overflow": max_overflow if max_overflow is not None else app_settings.db_max_overflow,
+        "pool_timeout": app_settings.db_pool_timeout,
+        "pool_recycle": POOL_RECYCLE_SECONDS,
+    }
+    if make_url(connection_string).get_driver_name() == "asyncpg":
+        engine_config_kwargs["connect_args"] = {"server_settings": ASYNCPG_SERVER_SETTINGS}
 
     return SQLAlchemyAsyncConfig(
-        connection_string=app_settings.database_url.unicode_string(),
+        connection_string=connection_string,
         engine_config=EngineConfig(**engine_config_kwargs),
-        session_config=AsyncSessionConfig(expire_on_commit=False),
+        session_config=AsyncSessionConfig(
+            expire_on_commit=False,
+            info={STRICT_LOADING_KEY: app_settings.debug},
+        ),
         before_send_handler="autocommit",
         alembic_config=AlembicAsyncConfig(
             toml_file="pyproject.toml",
@@ -51,6 +72,41 @@ def create_sqlalchemy_config(
     )
 
 
+def with_strict_loading(session: AsyncSession, loader_options: Sequence[LoaderOption]) -> list[LoaderOption]:
+    """Append a ``raiseload("*")`` option when the session has strict loading enabled.
+
+    Strict loading is enabled in debug mode, so any relationship that a query does
+    not load explicitly raises on access instead of silently emitting extra queries.
+
+    Args:
+        session: Session the loader options will be used with
+        loader_options: Loader options declared for the query
+
+    Returns:
+        The loader options, with ``raiseload("*")`` appended if strict loading is on
+
+    """
+    if session.info.get(STRICT_LOADING_KEY):
+        return [*loader_options, raiseload("*")]
+    return list(loader_options)
+
+
+def run_after_commit(session: AsyncSession, callback: Callable[[], object]) -> None:
+    """Run a callback once the session's current transaction has been committed.
+
+    Request sessions are committed by the ``autocommit`` before-send handler, after
+    the route handler returns. Cache invalidations registered here run only once the
+    change is visible to other sessions; if the transaction is rolled back instead,
+    nothing changed and the callback is never run.
+
+    Args:
+        session: Session whose commit should trigger the callback
+        callback: Function to call after the commit
+
+    """
+    event.listen(session.sync_session, "after_commit", lambda _session: callback(), once=True)
+
+
 def create_sqlalchemy_plugin(
     app_settings: Settings | None = None,
     pool_size: int | None = None,
@@ -60,8 +116,8 @@ def create_sqlalchemy_plugin(
 
     Args:
         app_settings: Settings instance to use. If None, uses global settings.
-        pool_size: Size of the connection pool. If None, uses SQLAlchemy default.
-        max_overflow: Maximum overflow size. If None, uses SQLAlchemy default.
+        pool_size: Size of the connection pool. If None, uses the configured ``db_pool_size``.
+        max_overflow: Maximum overflow size. If None, uses the configured ``db_max_overflow``.
 
     Returns:
         SQLAlchemy plugin instance (config accessible via plugin.config[0])
@@ -15,7 +15,8 @@ from litestar.openapi.plugins import ScalarRenderPlugin, SwaggerRenderPlugin
 from litestar.openapi.spec import Server
 from litestar.plugins.structlog import StructlogConfig, StructlogPlugin
 
-from app.api.accounts.auth.security import create_oauth2_auth
+from app.api.accounts.auth.security import clear_user_cache, create_oauth2_auth
+from app.api.accounts.permissions.services import clear_permission_list_cache
 from app.api.accounts.router import accounts_router
 from app.api.health import health_router
 from app.config import Settings, settings
@@ -40,8 +41,9 @@ def create_app(
         app_settings: Settings instance to use. If None, uses global settings.
         title: Title for the OpenAPI documentation
         enable_structlog: Whether to enable structlog logging plugin
-        pool_size: Database connection pool size. If None, uses SQLAlchemy default.
-        max_overflow: Database connection pool max overflow. If None, uses SQLAlchemy default.
+        pool_size: Database connection pool size. If None, uses the configured ``db_pool_size``.
+        max_overflow: Database connection pool max overflow. If None, uses the configured
+            ``db_max_overflow``.
 
     Returns:
         Configured Litestar application instance
@@ -57,11 +59,16 @@ def create_app(
     )
     app_sqlalchemy_config = app_sqlalchemy_plugin.config[0]
 
-    openapi_config = OpenAPIConfig(
-        title=title,
-        version="0.1.0",
-        render_plugins=[ScalarRenderPlugin(), SwaggerRenderPlugin()],
-        servers=[Server(url="")],
+    # The OpenAPI schema and its documentation pages are only served in debug mode.
+    openapi_config = (
+        OpenAPIConfig(
+            title=title,
+            version="0.1.0",
+            render_plugins=[ScalarRenderPlugin(), SwaggerRenderPlugin()],
+            servers=[Server(url="")],
+        )
+        if app_settings.debug
+        else None
     )
 
     structlog_plugin = StructlogPlugin(
@@ -95,12 +102,14 @@ def create_app(
         openapi_config=openapi_config,
         cors_config=cors_config,
         on_app_init=on_app_init,
+        on_startup=[clear_user_cache, clear_permission_list_cache],
         plugins=plugins,
         debug=app_settings.debug,
     )
 
     # Store config in app state
     litestar_app.state.sqlalchemy_config = app_sqlalchemy_config
+    litestar_app.state.session_maker = app_sqlalchemy_config.create_session_maker()
     litestar_app.state.app_settings = app_settings
     litestar_app.state.oauth2_auth = oauth2_auth
 
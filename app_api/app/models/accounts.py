@@ -5,7 +5,6 @@ from uuid import UUID
 
 from advanced_alchemy.base import AdvancedDeclarativeBase, CommonTableAttributes, UUIDv7AuditBase
 from sqlalchemy import ForeignKey, String
-from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -51,13 +50,13 @@ class Role(UUIDv7AuditBase):
     )
 
 
-class UserRole(CommonTableAttributes, AdvancedDeclarativeBase, AsyncAttrs):
+class UserRole(CommonTableAttributes, AdvancedDeclarativeBase):
     """Association model for User-Role many-to-many relationship."""
 
     __tablename__ = "accounts_users_roles"
 
     user_id: Mapped[UUID] = mapped_column(ForeignKey("accounts_users.id"), primary_key=True)
-    role_id: Mapped[UUID] = mapped_column(ForeignKey("accounts_roles.id"), primary_key=True)
+    role_id: Mapped[UUID] = mapped_column(ForeignKey("accounts_roles.id"), primary_key=True, index=True)
 
 
 class Permission(UUIDv7AuditBase):
@@ -78,10 +77,14 @@ class Permission(UUIDv7AuditBase):
     )
 
 
-class RolePermission(CommonTableAttributes, AdvancedDeclarativeBase, AsyncAttrs):
+class RolePermission(CommonTableAttributes, AdvancedDeclarativeBase):
     """Association model for Role-Permission many-to-many relationship."""
 
     __tablename__ = "accounts_roles_permissions"
 
     role_id: Mapped[UUID] = mapped_column(ForeignKey("accounts_roles.id"), primary_key=True)
-    permission_id: Mapped[UUID] = mapped_column(ForeignKey("accounts_permissions.id"), primary_key=True)
+    permission_id: Mapped[UUID] = mapped_column(
+        ForeignKey("accounts_permissions.id"),
+        primary_key=True,
+        index=True,
+    )
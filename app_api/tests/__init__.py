@@ -1 +1,9 @@
 """Test package initialization for Pytest fixtures and modules."""
+
+import os
+
+# Minimal Argon2 parameters (8 KiB is the smallest memory cost Argon2 accepts for one lane) for the
+# test suite; must be set before the app settings are loaded
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "8")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")
@@ -3,14 +3,17 @@
 This module contains reusable test data and fixtures specific to accounts functionality.
 """
 
+import asyncio
 from collections.abc import AsyncIterator
+from typing import Any
 
 import pytest_asyncio
+from litestar import Litestar
 from litestar.testing.client import AsyncTestClient
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from app.api.accounts.users.services import password_hasher
+from app.api.accounts.users.services import hash_password
 from app.models.accounts import Permission, Role, User
 
 TEST_ROLES = {
@@ -108,8 +111,13 @@ async def _populate_accounts(engine: AsyncEngine) -> None:
 
         await session.flush()  # Get role IDs
 
+        # Hash all passwords concurrently in the Argon2 thread pool
+        password_hashes = await asyncio.gather(
+            *(hash_password(str(user_data["password"])) for user_data in TEST_USERS.values()),
+        )
+
         # Create users with roles
-        for user_data in TEST_USERS.values():
+        for user_data, password_hash in zip(TEST_USERS.values(), password_hashes, strict=True):
             user_role_names = user_data["roles"]
             assert isinstance(user_role_names, list)
             user_roles = [role_objects[str(role_name)] for role_name in user_role_names]
@@ -118,7 +126,7 @@ async def _populate_accounts(engine: AsyncEngine) -> None:
                 username=str(user_data["username"]),
                 email=str(user_data["email"]),
                 fullname=str(user_data["fullname"]),
-                password=password_hasher.hash(str(user_data["password"])),
+                password=password_hash,
                 roles=user_roles,
             )
             session.add(user)
@@ -148,69 +156,76 @@ async def _populate_permissions(engine: AsyncEngine) -> None:
 @pytest_asyncio.fixture(scope="function")
 async def client_with_roles(
     client: AsyncTestClient,
-    session_database: dict[str, str],
+    db_engine: AsyncEngine,
 ) -> AsyncIterator[AsyncTestClient]:
     """Create a test client with pre-populated roles."""
-    engine = create_async_engine(session_database["url"], echo=False, poolclass=NullPool)
-    try:
-        await _populate_roles(engine)
-        yield client
-    finally:
-        await engine.dispose()
+    await _populate_roles(db_engine)
+    yield client
 
 
 @pytest_asyncio.fixture(scope="function")
 async def client_with_accounts(
     client: AsyncTestClient,
-    session_database: dict[str, str],
+    db_engine: AsyncEngine,
 ) -> AsyncIterator[AsyncTestClient]:
     """Create a test client with pre-populated users and roles."""
-    engine = create_async_engine(session_database["url"], echo=False, poolclass=NullPool)
-    try:
-        await _populate_accounts(engine)
-        yield client
-    finally:
-        await engine.dispose()
+    await _populate_accounts(db_engine)
+    yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def admin_auth_header(test_app: Litestar) -> str:
+    """Issue a JWT for the admin test user once per session.
+
+    The admin user is recreated with the same ID for every test, so one token stays
+    valid for the whole session and tests don't have to log in through the API.
+    """
+    test_user = TEST_USERS["admin"]
+    oauth2_auth = test_app.state.oauth2_auth
+    token = oauth2_auth.create_token(
+        identifier=str(test_user["id"]),
+        token_extras={"name": test_user["fullname"], "email": test_user["email"]},
+    )
+    return oauth2_auth.format_auth_header(token)
 
 
 @pytest_asyncio.fixture(scope="function")
 async def authenticated_client(
     client: AsyncTestClient,
-    session_database: dict[str, str],
+    db_engine: AsyncEngine,
+    admin_auth_header: str,
 ) -> AsyncIterator[AsyncTestClient]:
-    """Create a test client with pre-populated users and roles, and authenticate a user."""
-    engine = create_async_engine(session_database["url"], echo=False, poolclass=NullPool)
-    try:
-        await _populate_accounts(engine)
-
-        # Log in a test user to authenticate the client
-        test_user = TEST_USERS["admin"]
-        login_data = {
-            "username": test_user["username"],
-            "password": test_user["password"],
-        }
-
-        # Login to set the JWT token in a cookie
-        await client.post(
-            "/accounts/auth/login",
-            data=login_data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+    """Create a test client with pre-populated users and roles, authenticated as the admin user."""
+    await _populate_accounts(db_engine)
 
-        yield client
-    finally:
-        await engine.dispose()
+    client.headers["Authorization"] = admin_auth_header
+
+    yield client
+
+    del client.headers["Authorization"]
 
 
 @pytest_asyncio.fixture(scope="function")
 async def client_with_permissions(
     authenticated_client: AsyncTestClient,
-    session_database: dict[str, str],
+    db_engine: AsyncEngine,
 ) -> AsyncIterator[AsyncTestClient]:
     """Create a test client with pre-populated users, roles, and permissions."""
-    engine = create_async_engine(session_database["url"], echo=False, poolclass=NullPool)
+    await _populate_permissions(db_engine)
+    yield authenticated_client
+
+
+@pytest_asyncio.fixture(scope="function")
+async def statement_log(client: AsyncTestClient) -> AsyncIterator[list[str]]:
+    """Record the SQL statements executed through the test app's engine."""
+    engine = client.app.state.sqlalchemy_config.get_engine().sync_engine
+    statements: list[str] = []
+
+    def _record(*args: Any) -> None:  # noqa: ANN401
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", _record)
     try:
-        await _populate_permissions(engine)
-        yield authenticated_client
+        yield statements
     finally:
-        await engine.dispose()
+        event.remove(engine, "before_cursor_execute", _record)
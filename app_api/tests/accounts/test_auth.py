@@ -3,15 +3,22 @@
 This module contains integration tests for login and logout operations.
 """
 
+from uuid import UUID
+
 import pytest
 from litestar.testing.client import AsyncTestClient
+from pwdlib import PasswordHash
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.api.accounts.users.services import password_hasher
+from app.models.accounts import User
 
 from .conftest import TEST_USERS
 
 
 @pytest.mark.asyncio
 async def test_login_success(client_with_accounts: AsyncTestClient) -> None:
-    """Test successful user login."""
+    """Test successful user login, and that each login updates the last_login timestamp."""
     test_user = TEST_USERS["admin"]
     login_data = {
         "username": test_user["username"],
@@ -21,7 +28,6 @@ async def test_login_success(client_with_accounts: AsyncTestClient) -> None:
     response = await client_with_accounts.post(
         "/accounts/auth/login",
         data=login_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
     )
 
     assert response.status_code == 200
@@ -35,6 +41,24 @@ async def test_login_success(client_with_accounts: AsyncTestClient) -> None:
     # Should set authentication cookie
     assert "token" in response.cookies
 
+    # Get the last_login recorded by this login
+    response = await client_with_accounts.get(f"/accounts/users/{test_user['id']}")
+    original_last_login = response.json()["last_login"]
+    assert original_last_login is not None
+
+    # Login again to trigger last_login update
+    login_response = await client_with_accounts.post(
+        "/accounts/auth/login",
+        data=login_data,
+    )
+
+    assert login_response.status_code == 200
+
+    # Check that last_login was updated
+    updated_user_response = await client_with_accounts.get(f"/accounts/users/{test_user['id']}")
+    updated_user = updated_user_response.json()
+    assert updated_user["last_login"] != original_last_login
+
 
 @pytest.mark.parametrize(
     ("username", "password", "expected_status", "error_message"),
@@ -58,7 +82,6 @@ async def test_login_invalid_credentials(
     response = await client_with_accounts.post(
         "/accounts/auth/login",
         data=login_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
     )
 
     assert response.status_code == expected_status
@@ -84,7 +107,6 @@ async def test_login_missing_credentials(
     response = await client_with_accounts.post(
         "/accounts/auth/login",
         data=login_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
     )
     assert response.status_code == expected_status
 
@@ -105,33 +127,31 @@ async def test_logout(authenticated_client: AsyncTestClient) -> None:
 
 
 @pytest.mark.asyncio
-async def test_login_updates_last_login(authenticated_client: AsyncTestClient) -> None:
-    """Test that successful login updates the last_login timestamp."""
-    test_user_data = TEST_USERS["admin"]
-
-    # Get current last_login for the test user
-    response = await authenticated_client.get(f"/accounts/users/{test_user_data['id']}")
-    test_user = response.json()
-    original_last_login = test_user.get("last_login")
+async def test_login_rehashes_outdated_password_hash(
+    client_with_accounts: AsyncTestClient,
+    db_engine: AsyncEngine,
+) -> None:
+    """Test that logging in replaces a hash created with outdated parameters."""
+    test_user = TEST_USERS["regular"]
+    user_id = UUID(str(test_user["id"]))
+    outdated_hash = PasswordHash.recommended().hash(str(test_user["password"]))
 
-    # Login again to trigger last_login update
-    login_data = {
-        "username": test_user_data["username"],
-        "password": test_user_data["password"],
-    }
+    async with AsyncSession(db_engine) as session:
+        user = await session.get_one(User, user_id)
+        user.password = outdated_hash
+        await session.commit()
 
-    login_response = await authenticated_client.post(
+    response = await client_with_accounts.post(
         "/accounts/auth/login",
-        data=login_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        data={"username": test_user["username"], "password": test_user["password"]},
     )
+    assert response.status_code == 200
 
-    assert login_response.status_code == 200
-
-    # Check that last_login was updated using authenticated client
-    updated_user_response = await authenticated_client.get(f"/accounts/users/{test_user['id']}")
-    updated_user = updated_user_response.json()
-    assert updated_user["last_login"] != original_last_login
+    async with AsyncSession(db_engine) as session:
+        user = await session.get_one(User, user_id)
+        assert user.password != outdated_hash
+        assert not password_hasher.current_hasher.check_needs_rehash(user.password)
+        assert password_hasher.verify(str(test_user["password"]), user.password)
 
 
 @pytest.mark.parametrize(
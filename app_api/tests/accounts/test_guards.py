@@ -5,12 +5,20 @@ across different endpoints and operations.
 """
 
 from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from functools import cache
+from types import SimpleNamespace
+from typing import Any, cast
+from uuid import UUID
 
 import pytest
 import pytest_asyncio
+from litestar.connection import ASGIConnection
+from litestar.security.jwt import Token
 from litestar.testing.client import AsyncTestClient
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from app.api.accounts.auth.security import current_user_from_token, invalidate_user
 from app.api.accounts.users.services import password_hasher
 from app.models.accounts import Permission, Role, User
 
@@ -23,229 +31,151 @@ TEST_PERMISSIONS_DATA = {
     "users:delete": {"name": "users:delete", "resource": "users", "action": "delete"},
     "roles:list": {"name": "roles:list", "resource": "roles", "action": "list"},
     "roles:create": {"name": "roles:create", "resource": "roles", "action": "create"},
+    "roles:update": {"name": "roles:update", "resource": "roles", "action": "update"},
+    "permissions:list": {"name": "permissions:list", "resource": "permissions", "action": "list"},
+    "permissions:update": {"name": "permissions:update", "resource": "permissions", "action": "update"},
 }
 
+# ID of a user that is never created, for requests that the guards must reject
+DUMMY_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+@cache
+def _hash_password(password: str) -> str:
+    """Hash a test password once per process; the fixtures only log in with it."""
+    return password_hasher.hash(password)
+
 
 async def _create_user_with_permissions(
     engine: AsyncEngine,
     username: str,
     password: str,
     permission_names: list[str],
-) -> tuple[User, str]:
-    """Create a user with specific permissions."""
+) -> tuple[str, str]:
+    """Create a user with specific permissions and return its login credentials."""
     async with AsyncSession(engine) as session:
         # Create permissions
-        permissions = []
-        for perm_name in permission_names:
-            perm_data = TEST_PERMISSIONS_DATA[perm_name]
-            permission = Permission(
-                name=perm_data["name"],
-                resource=perm_data["resource"],
-                action=perm_data["action"],
-                is_active=True,
-            )
-            session.add(permission)
-            permissions.append(permission)
+        permissions = [
+            Permission(**TEST_PERMISSIONS_DATA[perm_name], is_active=True) for perm_name in permission_names
+        ]
 
         # Create role with permissions
         role = Role(name=f"{username}_role", description="Test role", is_active=True, permissions=permissions)
-        session.add(role)
 
         # Create user with role
         user = User(
             username=username,
             email=f"{username}@test.com",
             fullname=f"Test {username}",
-            password=password_hasher.hash(password),
+            password=_hash_password(password),
             is_active=True,
             roles=[role],
         )
-        session.add(user)
+        session.add_all([*permissions, role, user])
 
         await session.commit()
-        await session.refresh(user)
-
-        return user, password
-
-
-@pytest_asyncio.fixture(scope="function")
-async def client_with_list_permission(
-    client: AsyncTestClient,
-    session_database: dict[str, str],
-) -> AsyncIterator[AsyncTestClient]:
-    """Create authenticated client with only users:list permission."""
-    engine = create_async_engine(session_database["url"], echo=False)
-    try:
-        user, password = await _create_user_with_permissions(
-            engine,
-            "list_user",
-            "password123",
-            ["users:list"],
-        )
-
-        # Authenticate
-        await client.post(
-            "/accounts/auth/login",
-            data={"username": user.username, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-
-        yield client
-    finally:
-        await engine.dispose()
 
-
-@pytest_asyncio.fixture(scope="function")
-async def client_with_read_permission(
-    client: AsyncTestClient,
-    session_database: dict[str, str],
-) -> AsyncIterator[AsyncTestClient]:
-    """Create authenticated client with only users:read permission."""
-    engine = create_async_engine(session_database["url"], echo=False)
-    try:
-        user, password = await _create_user_with_permissions(
-            engine,
-            "read_user",
-            "password123",
-            ["users:read"],
-        )
-
-        # Authenticate
-        await client.post(
-            "/accounts/auth/login",
-            data={"username": user.username, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-
-        yield client
-    finally:
-        await engine.dispose()
+    return username, password
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client_with_create_permission(
+async def permissioned_client(
+    request: pytest.FixtureRequest,
     client: AsyncTestClient,
-    session_database: dict[str, str],
+    db_engine: AsyncEngine,
 ) -> AsyncIterator[AsyncTestClient]:
-    """Create authenticated client with only users:create permission."""
-    engine = create_async_engine(session_database["url"], echo=False)
-    try:
-        user, password = await _create_user_with_permissions(
-            engine,
-            "create_user",
-            "password123",
-            ["users:create"],
-        )
-
-        # Authenticate
-        await client.post(
-            "/accounts/auth/login",
-            data={"username": user.username, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-
-        yield client
-    finally:
-        await engine.dispose()
-
-
-@pytest_asyncio.fixture(scope="function")
-async def client_with_full_user_permissions(
-    client: AsyncTestClient,
-    session_database: dict[str, str],
-) -> AsyncIterator[AsyncTestClient]:
-    """Create authenticated client with all user permissions."""
-    engine = create_async_engine(session_database["url"], echo=False)
-    try:
-        user, password = await _create_user_with_permissions(
-            engine,
-            "full_user",
-            "password123",
-            ["users:list", "users:read", "users:create", "users:update", "users:delete"],
-        )
-
-        # Authenticate
-        await client.post(
-            "/accounts/auth/login",
-            data={"username": user.username, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-
-        yield client
-    finally:
-        await engine.dispose()
-
-
-@pytest_asyncio.fixture(scope="function")
-async def client_with_no_permissions(
-    client: AsyncTestClient,
-    session_database: dict[str, str],
-) -> AsyncIterator[AsyncTestClient]:
-    """Create authenticated client with no permissions."""
-    engine = create_async_engine(session_database["url"], echo=False)
-    try:
-        user, password = await _create_user_with_permissions(engine, "no_perms_user", "password123", [])
-
-        # Authenticate
-        await client.post(
-            "/accounts/auth/login",
-            data={"username": user.username, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-
-        yield client
-    finally:
-        await engine.dispose()
+    """Create a client authenticated as a user holding the parametrized permissions."""
+    username, permission_names = request.param
+    username, password = await _create_user_with_permissions(
+        db_engine,
+        username,
+        "password123",
+        permission_names,
+    )
+
+    # Authenticate
+    await client.post(
+        "/accounts/auth/login",
+        data={"username": username, "password": password},
+    )
+
+    yield client
+
+
+def _authenticated_as(username: str, *permission_names: str) -> pytest.MarkDecorator:
+    """Parametrize ``permissioned_client`` with a user holding the given permissions."""
+    return pytest.mark.parametrize(
+        "permissioned_client",
+        [(username, list(permission_names))],
+        indirect=True,
+        ids=[username],
+    )
+
+
+LIST_USER = _authenticated_as("list_user", "users:list")
+READ_USER = _authenticated_as("read_user", "users:read")
+CREATE_USER = _authenticated_as("create_user", "users:create")
+FULL_USER = _authenticated_as(
+    "full_user",
+    "users:list",
+    "users:read",
+    "users:create",
+    "users:update",
+    "users:delete",
+)
+NO_PERMS_USER = _authenticated_as("no_perms_user")
+ROLE_USER = _authenticated_as("role_user", "roles:list", "roles:create")
 
 
 # Tests for guards blocking access without permissions
 
 
+@pytest.mark.parametrize(
+    ("permissioned_client", "method", "path", "body"),
+    [
+        pytest.param(("no_perms_user", []), "GET", "/accounts/users/", None, id="list"),
+        pytest.param(
+            ("list_user", ["users:list"]),
+            "POST",
+            "/accounts/users/",
+            {
+                "username": "newuser",
+                "email": "new@test.com",
+                "fullname": "New User",
+                "password": "password123",
+                "roles": [],
+            },
+            id="create",
+        ),
+        pytest.param(
+            ("read_user", ["users:read"]),
+            "PATCH",
+            f"/accounts/users/{DUMMY_USER_ID}",
+            {"fullname": "Updated Name"},
+            id="update",
+        ),
+        pytest.param(
+            ("read_user", ["users:read"]),
+            "DELETE",
+            f"/accounts/users/{DUMMY_USER_ID}",
+            None,
+            id="delete",
+        ),
+    ],
+    indirect=["permissioned_client"],
+)
 @pytest.mark.asyncio
-async def test_list_users_denied_without_permission(client_with_no_permissions: AsyncTestClient) -> None:
-    """Test that listing users is denied without users:list permission."""
-    response = await client_with_no_permissions.get("/accounts/users/")
-
-    assert response.status_code == 403
-    assert "Permission denied" in response.text
-
-
-@pytest.mark.asyncio
-async def test_create_user_denied_without_permission(client_with_list_permission: AsyncTestClient) -> None:
-    """Test that creating users is denied without users:create permission."""
-    user_data = {
-        "username": "newuser",
-        "email": "new@test.com",
-        "fullname": "New User",
-        "password": "password123",
-        "roles": [],
-    }
-    response = await client_with_list_permission.post("/accounts/users/", json=user_data)
-
-    assert response.status_code == 403
-    assert "Permission denied" in response.text
-
-
-@pytest.mark.asyncio
-async def test_update_user_denied_without_permission(client_with_read_permission: AsyncTestClient) -> None:
-    """Test that updating users is denied without users:update permission."""
-    # Use a dummy UUID
-    user_id = "00000000-0000-0000-0000-000000000001"
-    update_data = {"fullname": "Updated Name"}
-
-    response = await client_with_read_permission.patch(f"/accounts/users/{user_id}", json=update_data)
-
-    assert response.status_code == 403
-    assert "Permission denied" in response.text
-
-
-@pytest.mark.asyncio
-async def test_delete_user_denied_without_permission(client_with_read_permission: AsyncTestClient) -> None:
-    """Test that deleting users is denied without users:delete permission."""
-    # Use a dummy UUID
-    user_id = "00000000-0000-0000-0000-000000000001"
-
-    response = await client_with_read_permission.delete(f"/accounts/users/{user_id}")
+async def test_user_operation_denied_without_permission(
+    permissioned_client: AsyncTestClient,
+    method: str,
+    path: str,
+    body: dict | None,
+) -> None:
+    """Test that each user operation is denied to a user lacking its permission.
+
+    Every user holds some other permission (or none), so holding one does not grant the others.
+    """
+    response = await permissioned_client.request(method, path, json=body)
 
     assert response.status_code == 403
     assert "Permission denied" in response.text
@@ -255,9 +185,10 @@ async def test_delete_user_denied_without_permission(client_with_read_permission
 
 
 @pytest.mark.asyncio
-async def test_list_users_allowed_with_permission(client_with_list_permission: AsyncTestClient) -> None:
+@LIST_USER
+async def test_list_users_allowed_with_permission(permissioned_client: AsyncTestClient) -> None:
     """Test that listing users is allowed with users:list permission."""
-    response = await client_with_list_permission.get("/accounts/users/")
+    response = await permissioned_client.get("/accounts/users/")
 
     assert response.status_code == 200
     users = response.json()
@@ -265,7 +196,8 @@ async def test_list_users_allowed_with_permission(client_with_list_permission: A
 
 
 @pytest.mark.asyncio
-async def test_create_user_allowed_with_permission(client_with_create_permission: AsyncTestClient) -> None:
+@CREATE_USER
+async def test_create_user_allowed_with_permission(permissioned_client: AsyncTestClient) -> None:
     """Test that creating users is allowed with users:create permission."""
     user_data = {
         "username": "newuser_allowed",
@@ -274,7 +206,7 @@ async def test_create_user_allowed_with_permission(client_with_create_permission
         "password": "password123",
         "roles": [],
     }
-    response = await client_with_create_permission.post("/accounts/users/", json=user_data)
+    response = await permissioned_client.post("/accounts/users/", json=user_data)
 
     assert response.status_code == 201
     created_user = response.json()
@@ -282,10 +214,11 @@ async def test_create_user_allowed_with_permission(client_with_create_permission
 
 
 @pytest.mark.asyncio
-async def test_full_crud_with_all_permissions(client_with_full_user_permissions: AsyncTestClient) -> None:
+@FULL_USER
+async def test_full_crud_with_all_permissions(permissioned_client: AsyncTestClient) -> None:
     """Test that a user with all permissions can perform all CRUD operations."""
     # List users
-    response = await client_with_full_user_permissions.get("/accounts/users/")
+    response = await permissioned_client.get("/accounts/users/")
     assert response.status_code == 200
 
     # Create user
@@ -296,86 +229,172 @@ async def test_full_crud_with_all_permissions(client_with_full_user_permissions:
         "password": "password123",
         "roles": [],
     }
-    response = await client_with_full_user_permissions.post("/accounts/users/", json=user_data)
+    response = await permissioned_client.post("/accounts/users/", json=user_data)
     assert response.status_code == 201
     created_user = response.json()
     user_id = created_user["id"]
 
     # Read specific user
-    response = await client_with_full_user_permissions.get(f"/accounts/users/{user_id}")
+    response = await permissioned_client.get(f"/accounts/users/{user_id}")
     assert response.status_code == 200
     fetched_user = response.json()
     assert fetched_user["username"] == user_data["username"]
 
     # Update user
     update_data = {"fullname": "Updated Full CRUD User"}
-    response = await client_with_full_user_permissions.patch(f"/accounts/users/{user_id}", json=update_data)
+    response = await permissioned_client.patch(f"/accounts/users/{user_id}", json=update_data)
     assert response.status_code == 200
     updated_user = response.json()
     assert updated_user["fullname"] == update_data["fullname"]
 
     # Delete user
-    response = await client_with_full_user_permissions.delete(f"/accounts/users/{user_id}")
+    response = await permissioned_client.delete(f"/accounts/users/{user_id}")
     assert response.status_code == 204
 
     # Verify user is deleted (should return 404)
-    response = await client_with_full_user_permissions.get(f"/accounts/users/{user_id}")
+    response = await permissioned_client.get(f"/accounts/users/{user_id}")
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+@FULL_USER
+async def test_role_change_applies_to_token(permissioned_client: AsyncTestClient) -> None:
+    """Test that removing a user's roles takes effect for a token issued before the change."""
+    response = await permissioned_client.get("/accounts/users/")
+    assert response.status_code == 200
+
+    response = await permissioned_client.get("/accounts/users/me")
+    user_id = response.json()["id"]
+
+    response = await permissioned_client.patch(f"/accounts/users/{user_id}", json={"roles": []})
+    assert response.status_code == 200
+
+    response = await permissioned_client.get("/accounts/users/")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+@_authenticated_as("role_editor", "users:list", "roles:update")
+async def test_role_deactivation_applies_to_token(permissioned_client: AsyncTestClient) -> None:
+    """Test that deactivating a role takes effect for a user cached before the change."""
+    response = await permissioned_client.get("/accounts/users/")
+    assert response.status_code == 200
+
+    response = await permissioned_client.get("/accounts/users/me")
+    role_id = response.json()["roles"][0]["id"]
+
+    response = await permissioned_client.patch(f"/accounts/roles/{role_id}", json={"is_active": False})
+    assert response.status_code == 200
+
+    response = await permissioned_client.get("/accounts/users/")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+@_authenticated_as("permission_editor", "users:list", "permissions:list", "permissions:update")
+async def test_permission_deactivation_applies_to_token(permissioned_client: AsyncTestClient) -> None:
+    """Test that deactivating a permission takes effect for a user cached before the change."""
+    response = await permissioned_client.get("/accounts/permissions/")
+    assert response.status_code == 200
+    permission_id = next(
+        permission["id"] for permission in response.json() if permission["name"] == "users:list"
+    )
+
+    response = await permissioned_client.patch(
+        f"/accounts/permissions/{permission_id}",
+        json={"is_active": False},
+    )
+    assert response.status_code == 200
+
+    response = await permissioned_client.get("/accounts/users/")
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+@LIST_USER
+async def test_user_lookup_racing_invalidation_is_not_cached(
+    permissioned_client: AsyncTestClient,
+    db_engine: AsyncEngine,
+) -> None:
+    """Test that a user loaded while an invalidation happened is not cached.
+
+    The lookup may have read the user's state from before the change, so caching it
+    would serve that state until the cache entry expires.
+    """
+    response = await permissioned_client.get("/accounts/users/me")
+    user_id = response.json()["id"]
+    sessions_opened: list[AsyncSession] = []
+
+    def session_maker() -> AsyncSession:
+        # The change is committed, and the user invalidated, while this lookup is running
+        invalidate_user(user_id)
+        session = AsyncSession(db_engine)
+        sessions_opened.append(session)
+        return session
+
+    state = SimpleNamespace(
+        session_maker=session_maker,
+        app_settings=permissioned_client.app.state.app_settings,
+    )
+    connection = cast("ASGIConnection[Any, Any, Any, Any]", SimpleNamespace(app=SimpleNamespace(state=state)))
+    token = Token(exp=datetime.now(UTC) + timedelta(minutes=5), sub=user_id)
+
+    user = await current_user_from_token(token, connection)
+    assert str(user.id) == user_id
+
+    # Nothing was cached, so the next lookup with the same token loads the user again
+    await current_user_from_token(token, connection)
+    assert len(sessions_opened) == 2
+
+
 # Tests for inactive permissions/roles
 
 
 @pytest_asyncio.fixture(scope="function")
 async def client_with_inactive_permission(
     client: AsyncTestClient,
-    session_database: dict[str, str],
+    db_engine: AsyncEngine,
 ) -> AsyncIterator[AsyncTestClient]:
     """Create authenticated client with inactive permission."""
-    engine = create_async_engine(session_database["url"], echo=False)
-    try:
-        async with AsyncSession(engine) as session:
-            # Create inactive permission
-            permission = Permission(
-                name="users:list",
-                resource="users",
-                action="list",
-                is_active=False,  # Inactive!
-            )
-            session.add(permission)
-
-            # Create role with inactive permission
-            role = Role(
-                name="inactive_perm_role",
-                description="Test role",
-                is_active=True,
-                permissions=[permission],
-            )
-            session.add(role)
-
-            # Create user
-            user = User(
-                username="inactive_perm_user",
-                email="inactive@test.com",
-                fullname="Inactive Permission User",
-                password=password_hasher.hash("password123"),
-                is_active=True,
-                roles=[role],
-            )
-            session.add(user)
-
-            await session.commit()
-
-        # Authenticate
-        await client.post(
-            "/accounts/auth/login",
-            data={"username": "inactive_perm_user", "password": "password123"},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+    async with AsyncSession(db_engine) as session:
+        # Create inactive permission
+        permission = Permission(
+            name="users:list",
+            resource="users",
+            action="list",
+            is_active=False,  # Inactive!
         )
+        session.add(permission)
 
-        yield client
-    finally:
-        await engine.dispose()
+        # Create role with inactive permission
+        role = Role(
+            name="inactive_perm_role",
+            description="Test role",
+            is_active=True,
+            permissions=[permission],
+        )
+        session.add(role)
+
+        # Create user
+        user = User(
+            username="inactive_perm_user",
+            email="inactive@test.com",
+            fullname="Inactive Permission User",
+            password=_hash_password("password123"),
+            is_active=True,
+            roles=[role],
+        )
+        session.add(user)
+
+        await session.commit()
+
+    # Authenticate
+    await client.post(
+        "/accounts/auth/login",
+        data={"username": "inactive_perm_user", "password": "password123"},
+    )
+
+    yield client
 
 
 @pytest.mark.asyncio
@@ -390,37 +409,11 @@ async def test_inactive_permission_denied(client_with_inactive_permission: Async
 # Tests for different resources (roles)
 
 
-@pytest_asyncio.fixture(scope="function")
-async def client_with_role_permissions(
-    client: AsyncTestClient,
-    session_database: dict[str, str],
-) -> AsyncIterator[AsyncTestClient]:
-    """Create authenticated client with role permissions."""
-    engine = create_async_engine(session_database["url"], echo=False)
-    try:
-        user, password = await _create_user_with_permissions(
-            engine,
-            "role_user",
-            "password123",
-            ["roles:list", "roles:create"],
-        )
-
-        # Authenticate
-        await client.post(
-            "/accounts/auth/login",
-            data={"username": user.username, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-
-        yield client
-    finally:
-        await engine.dispose()
-
-
 @pytest.mark.asyncio
-async def test_list_roles_with_permission(client_with_role_permissions: AsyncTestClient) -> None:
+@ROLE_USER
+async def test_list_roles_with_permission(permissioned_client: AsyncTestClient) -> None:
     """Test that listing roles works with roles:list permission."""
-    response = await client_with_role_permissions.get("/accounts/roles/")
+    response = await permissioned_client.get("/accounts/roles/")
 
     assert response.status_code == 200
     roles = response.json()
@@ -428,9 +421,10 @@ async def test_list_roles_with_permission(client_with_role_permissions: AsyncTes
 
 
 @pytest.mark.asyncio
-async def test_list_roles_without_permission(client_with_list_permission: AsyncTestClient) -> None:
+@LIST_USER
+async def test_list_roles_without_permission(permissioned_client: AsyncTestClient) -> None:
     """Test that listing roles is denied without roles:list permission."""
-    response = await client_with_list_permission.get("/accounts/roles/")
+    response = await permissioned_client.get("/accounts/roles/")
 
     assert response.status_code == 403
     assert "Permission denied" in response.text
@@ -40,7 +40,7 @@ async def test_create_and_fetch_permission(client_with_permissions: AsyncTestCli
 
 @pytest.mark.asyncio
 async def test_list_permissions(client_with_permissions: AsyncTestClient) -> None:
-    """List permissions returns the existing permissions."""
+    """List permissions returns the existing permissions, ordered by name."""
     list_response = await client_with_permissions.get("/accounts/permissions/")
     assert list_response.status_code == 200
 
@@ -49,6 +49,53 @@ async def test_list_permissions(client_with_permissions: AsyncTestClient) -> Non
     returned_ids = {permission["id"] for permission in permissions}
     expected_ids = {permission["id"] for permission in TEST_PERMISSIONS.values()}
     assert expected_ids.issubset(returned_ids)
+    names = [permission["name"] for permission in permissions]
+    assert names == sorted(names)
+
+
+@pytest.mark.asyncio
+async def test_list_permissions_after_create(client_with_permissions: AsyncTestClient) -> None:
+    """A created permission is listed even if the list was requested just before."""
+    await client_with_permissions.get("/accounts/permissions/")
+
+    create_response = await client_with_permissions.post(
+        "/accounts/permissions/",
+        json=_permission_payload("perm-listed"),
+    )
+    assert create_response.status_code == 201
+
+    list_response = await client_with_permissions.get("/accounts/permissions/")
+    assert create_response.json()["id"] in {permission["id"] for permission in list_response.json()}
+
+
+@pytest.mark.asyncio
+async def test_list_permissions_after_update(client_with_permissions: AsyncTestClient) -> None:
+    """An updated permission is listed with its new data even if the list was requested just before."""
+    permission_id = TEST_PERMISSIONS["view_users"]["id"]
+    await client_with_permissions.get("/accounts/permissions/")
+
+    update_response = await client_with_permissions.patch(
+        f"/accounts/permissions/{permission_id}",
+        json={"is_active": False},
+    )
+    assert update_response.status_code == 200
+
+    list_response = await client_with_permissions.get("/accounts/permissions/")
+    listed = {permission["id"]: permission for permission in list_response.json()}
+    assert listed[permission_id]["is_active"] is False
+
+
+@pytest.mark.asyncio
+async def test_list_permissions_after_delete(client_with_permissions: AsyncTestClient) -> None:
+    """A deleted permission is no longer listed even if the list was requested just before."""
+    permission_id = TEST_PERMISSIONS["view_users"]["id"]
+    await client_with_permissions.get("/accounts/permissions/")
+
+    delete_response = await client_with_permissions.delete(f"/accounts/permissions/{permission_id}")
+    assert delete_response.status_code == 204
+
+    list_response = await client_with_permissions.get("/accounts/permissions/")
+    assert permission_id not in {permission["id"] for permission in list_response.json()}
 
 
 @pytest.mark.asyncio
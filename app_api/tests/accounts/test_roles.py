@@ -81,6 +81,33 @@ async def test_update_role(authenticated_client: AsyncTestClient) -> None:
         assert get_role_data[key] == value
 
 
+@pytest.mark.asyncio
+async def test_list_roles_query_count_is_constant(
+    client_with_permissions: AsyncTestClient,
+    statement_log: list[str],
+) -> None:
+    """Listing roles issues the same number of queries regardless of roles and permissions."""
+    permission_ids = [{"id": permission["id"]} for permission in TEST_PERMISSIONS.values()]
+
+    # Warm up the authenticated user cache so only the listing itself is counted
+    await client_with_permissions.get("/accounts/roles/")
+    statement_log.clear()
+    response = await client_with_permissions.get("/accounts/roles/")
+    assert response.status_code == 200
+    baseline = len(statement_log)
+
+    for index in range(3):
+        role_payload = {"name": f"counted-role-{index}", "permissions": permission_ids}
+        response = await client_with_permissions.post("/accounts/roles/", json=role_payload)
+        assert response.status_code == 201
+
+    statement_log.clear()
+    response = await client_with_permissions.get("/accounts/roles/")
+    assert response.status_code == 200
+    assert len(response.json()) == len(TEST_ROLES) + 3
+    assert len(statement_log) == baseline
+
+
 @pytest.mark.asyncio
 async def test_create_role_with_permissions(client_with_permissions: AsyncTestClient) -> None:
     """Roles can be created with associated permissions."""
@@ -134,3 +161,44 @@ async def test_update_role_permissions(client_with_permissions: AsyncTestClient)
     fetched_role = fetch_response.json()
     fetched_permission_ids = {permission["id"] for permission in fetched_role["permissions"]}
     assert fetched_permission_ids == {new_permission["id"]}
+
+
+@pytest.mark.asyncio
+async def test_create_roles_batch(client_with_permissions: AsyncTestClient) -> None:
+    """Several roles can be created with their permissions in a single request."""
+    view_users = TEST_PERMISSIONS["view_users"]
+    manage_roles = TEST_PERMISSIONS["manage_roles"]
+
+    roles_payload = [
+        {"name": "batch-viewer", "permissions": [{"id": view_users["id"]}]},
+        {"name": "batch-manager", "permissions": [{"id": view_users["id"]}, {"id": manage_roles["id"]}]},
+        {"name": "batch-empty", "description": "No permissions", "permissions": []},
+    ]
+
+    response = await client_with_permissions.post("/accounts/roles/batch", json=roles_payload)
+
+    assert response.status_code == 201
+    created_roles = response.json()
+    assert [role["name"] for role in created_roles] == [role["name"] for role in roles_payload]
+    for created_role, role_payload in zip(created_roles, roles_payload, strict=True):
+        assert {permission["id"] for permission in created_role["permissions"]} == {
+            permission["id"] for permission in role_payload["permissions"]
+        }
+
+    list_response = await client_with_permissions.get("/accounts/roles/")
+    assert len(list_response.json()) == len(TEST_ROLES) + len(roles_payload)
+
+
+@pytest.mark.asyncio
+async def test_create_roles_batch_with_unknown_permission(client_with_permissions: AsyncTestClient) -> None:
+    """A batch referencing an unknown permission is rejected as a whole."""
+    roles_payload = [
+        {"name": "batch-valid", "permissions": [{"id": TEST_PERMISSIONS["view_users"]["id"]}]},
+        {"name": "batch-invalid", "permissions": [{"id": str(uuid4())}]},
+    ]
+
+    response = await client_with_permissions.post("/accounts/roles/batch", json=roles_payload)
+
+    assert response.status_code == 400
+    list_response = await client_with_permissions.get("/accounts/roles/")
+    assert len(list_response.json()) == len(TEST_ROLES)
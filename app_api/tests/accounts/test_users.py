@@ -3,11 +3,22 @@
 This module contains integration tests for user operations.
 """
 
+from typing import Any
+
 import pytest
 from litestar.testing.client import AsyncTestClient
 
 from tests.accounts.conftest import TEST_ROLES, TEST_USERS
 
+USER_FIELDS = frozenset({"id", "username", "fullname", "is_active", "created_at"})
+
+
+def _assert_user_shape(user: dict) -> None:
+    """Assert that a user payload has the public user fields and does not expose the password."""
+    assert user.keys() >= USER_FIELDS
+    assert isinstance(user["is_active"], bool)
+    assert "password" not in user  # Password should not be exposed
+
 
 @pytest.mark.asyncio
 async def test_list_users(authenticated_client: AsyncTestClient) -> None:
@@ -21,27 +32,51 @@ async def test_list_users(authenticated_client: AsyncTestClient) -> None:
 
     # Check that users have proper structure
     for user in users_list:
-        assert "id" in user
-        assert "username" in user
-        assert "fullname" in user
-        assert "is_active" in user
-        assert "created_at" in user
-        assert isinstance(user["is_active"], bool)
-        assert "password" not in user  # Password should not be exposed
+        _assert_user_shape(user)
 
 
 @pytest.mark.asyncio
-async def test_create_user(authenticated_client: AsyncTestClient) -> None:
-    """Test successful user creation."""
-    username = "new_user"
-    email = "new_user@example.com"
+async def test_list_users_query_count_is_constant(
+    authenticated_client: AsyncTestClient,
+    statement_log: list[str],
+) -> None:
+    """Listing users issues the same number of queries regardless of users and roles."""
+    role_ids = [{"id": role["id"]} for role in TEST_ROLES.values()]
+
+    # Warm up the authenticated user cache so only the listing itself is counted
+    await authenticated_client.get("/accounts/users/")
+    statement_log.clear()
+    response = await authenticated_client.get("/accounts/users/")
+    assert response.status_code == 200
+    baseline = len(statement_log)
+
+    for index in range(3):
+        user_data = {
+            "username": f"counted_user_{index}",
+            "fullname": f"Counted User {index}",
+            "password": "password123",
+            "roles": role_ids,
+        }
+        response = await authenticated_client.post("/accounts/users/", json=user_data)
+        assert response.status_code == 201
+
+    statement_log.clear()
+    response = await authenticated_client.get("/accounts/users/")
+    assert response.status_code == 200
+    assert len(response.json()) == len(TEST_USERS) + 3
+    assert len(statement_log) == baseline
+
 
+@pytest.mark.parametrize("role_names", [[], ["user"]], ids=["without_roles", "with_roles"])
+@pytest.mark.asyncio
+async def test_create_user(authenticated_client: AsyncTestClient, role_names: list[str]) -> None:
+    """Test successful user creation, with and without role assignment."""
     user_data = {
-        "username": username,
-        "email": email,
+        "username": "new_user",
+        "email": "new_user@example.com",
         "fullname": "Brand New User",
         "password": "newpass123",
-        "roles": [],
+        "roles": [{"id": TEST_ROLES[role_name]["id"]} for role_name in role_names],
     }
     response = await authenticated_client.post("/accounts/users/", json=user_data)
 
@@ -50,33 +85,65 @@ async def test_create_user(authenticated_client: AsyncTestClient) -> None:
     for field in ["username", "email", "fullname"]:
         assert data[field] == user_data[field]
     assert data["is_active"] is True
-    assert "password" not in data
-    assert "id" in data
-    assert "created_at" in data
+    assert [role["name"] for role in data["roles"]] == role_names
+    _assert_user_shape(data)
 
 
 @pytest.mark.asyncio
-async def test_create_user_with_roles(authenticated_client: AsyncTestClient) -> None:
-    """Test user creation with role assignment."""
-    username = "new_user_with_role"
-    email = "new_user@example.com"
-
-    user_role = TEST_ROLES["user"]
-
-    user_data = {
-        "username": username,
-        "email": email,
-        "fullname": "User With Role Unique",
-        "password": "rolepass123",
-        "roles": [{"id": user_role["id"]}],
-    }
-    response = await authenticated_client.post("/accounts/users/", json=user_data)
+async def test_create_users_batch(authenticated_client: AsyncTestClient) -> None:
+    """Test creating several users with roles in a single request."""
+    users_data = [
+        {
+            "username": "batch_user_one",
+            "email": "batch_one@example.com",
+            "fullname": "Batch User One",
+            "password": "batchpass1",
+            "roles": [{"id": TEST_ROLES["user"]["id"]}],
+        },
+        {
+            "username": "batch_user_two",
+            "fullname": "Batch User Two",
+            "password": "batchpass2",
+            "roles": [{"id": TEST_ROLES["user"]["id"]}, {"id": TEST_ROLES["guest"]["id"]}],
+        },
+    ]
+    response = await authenticated_client.post("/accounts/users/batch", json=users_data)
 
     assert response.status_code == 201
     data = response.json()
-    assert data["username"] == username
-    assert len(data["roles"]) == 1
-    assert data["roles"][0]["name"] == "user"
+    assert [user["username"] for user in data] == ["batch_user_one", "batch_user_two"]
+    assert [role["name"] for role in data[0]["roles"]] == ["user"]
+    assert {role["name"] for role in data[1]["roles"]} == {"user", "guest"}
+    for user in data:
+        _assert_user_shape(user)
+
+    login_response = await authenticated_client.post(
+        "/accounts/auth/login",
+        data={"username": "batch_user_two", "password": "batchpass2"},
+    )
+    assert login_response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_create_users_batch_duplicate_username(authenticated_client: AsyncTestClient) -> None:
+    """Test that a batch containing a taken username is rejected as a whole."""
+    users_data = [
+        {"username": "batch_fresh_user", "fullname": "Fresh", "password": "freshpass", "roles": []},
+        {
+            "username": TEST_USERS["regular"]["username"],
+            "fullname": "Taken",
+            "password": "takenpass",
+            "roles": [],
+        },
+    ]
+    response = await authenticated_client.post("/accounts/users/batch", json=users_data)
+
+    assert response.status_code == 409
+    availability = await authenticated_client.get(
+        "/accounts/users/username-available",
+        params={"username": "batch_fresh_user"},
+    )
+    assert availability.json()["available"] is True
 
 
 @pytest.mark.asyncio
@@ -92,42 +159,30 @@ async def test_get_user_by_id(authenticated_client: AsyncTestClient) -> None:
     assert user_data["id"] == test_user["id"]
     assert user_data["username"] == test_user["username"]
     assert user_data["fullname"] == test_user["fullname"]
-    assert "password" not in user_data
+    _assert_user_shape(user_data)
 
 
+@pytest.mark.parametrize(
+    "update_data",
+    [
+        {"fullname": "Updated Full Name", "email": "updated@example.com", "is_active": False},
+        {"roles": [{"id": TEST_ROLES["admin"]["id"]}]},
+    ],
+    ids=["fields", "roles"],
+)
 @pytest.mark.asyncio
-async def test_update_user(authenticated_client: AsyncTestClient) -> None:
-    """Test updating a user."""
+async def test_update_user(authenticated_client: AsyncTestClient, update_data: dict[str, Any]) -> None:
+    """Test updating a user's fields or roles."""
     user_to_update = TEST_USERS["regular"]
 
-    # Update the user (include current roles to avoid issues)
-    update_data = {
-        "fullname": "Updated Full Name",
-        "email": "updated@example.com",
-        "is_active": False,
-    }
     response = await authenticated_client.patch(f"/accounts/users/{user_to_update['id']}", json=update_data)
 
     assert response.status_code == 200
     updated_user = response.json()
+    # Roles are sent as ID references and returned as full role objects
+    returned = {**updated_user, "roles": [{"id": role["id"]} for role in updated_user["roles"]]}
     for key, value in update_data.items():
-        assert updated_user[key] == value
-
-
-@pytest.mark.asyncio
-async def test_update_user_roles(authenticated_client: AsyncTestClient) -> None:
-    """Test updating user roles."""
-    user_to_update = TEST_USERS["regular"]
-    admin_role = TEST_ROLES["admin"]
-
-    # Update user to have admin role
-    update_data = {"roles": [{"id": admin_role["id"]}]}
-    response = await authenticated_client.patch(f"/accounts/users/{user_to_update['id']}", json=update_data)
-
-    assert response.status_code == 200
-    updated_user = response.json()
-    assert len(updated_user["roles"]) == 1
-    assert updated_user["roles"][0]["name"] == "admin"
+        assert returned[key] == value
 
 
 @pytest.mark.parametrize(
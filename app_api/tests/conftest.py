@@ -5,10 +5,11 @@ from typing import cast
 
 import pytest
 import pytest_asyncio
+from litestar import Litestar
 from litestar.testing.client import AsyncTestClient
 from pytest_databases.docker.postgres import PostgresService
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.pool import NullPool
 
 from app.config import Settings
@@ -70,67 +71,56 @@ async def session_database(
         async with cleanup_engine.connect() as conn:
             # Terminate connections to the test database first
             await conn.execute(
-                text(f"""
+                text("""
                 SELECT pg_terminate_backend(pid)
                 FROM pg_stat_activity
-                WHERE datname = '{db_name}' AND pid <> pg_backend_pid()
+                WHERE datname = :db_name AND pid <> pg_backend_pid()
             """),
+                {"db_name": db_name},
             )
             await conn.execute(text(f"DROP DATABASE IF EXISTS {db_name}"))
     finally:
         await cleanup_engine.dispose()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def clean_database(session_database: dict[str, str]) -> AsyncIterator[None]:
-    """Clean database between tests by truncating all tables.
+@pytest_asyncio.fixture(scope="session")
+async def db_engine(session_database: dict[str, str]) -> AsyncIterator[AsyncEngine]:
+    """Create a session-scoped engine for populating and inspecting the test database.
 
-    Uses two engines to avoid connection leaks:
-    1. terminator_engine: Kills orphaned connections to test DB (connects to postgres db)
-    2. clean_engine: Performs TRUNCATE operations (connects to test db)
+    Pools its connections so the truncation and data setup of each test reuse them instead of
+    reconnecting; connections are only idle between tests, so they never hold locks.
     """
-    from app.db import sqlalchemy_config
-
-    terminator_engine = create_async_engine(
-        f"{session_database['base_url']}/postgres",
-        echo=False,
-        isolation_level="AUTOCOMMIT",
-        poolclass=NullPool,
-    )
-    clean_engine = create_async_engine(session_database["url"], echo=False, poolclass=NullPool)
-
+    engine = create_async_engine(session_database["url"], echo=False, pool_size=2, max_overflow=2)
     try:
-        # Terminate stray connections from previous tests to prevent connection pool exhaustion
-        async with terminator_engine.connect() as conn:
-            query = (
-                f"SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
-                f"WHERE datname = '{session_database['db_name']}' AND pid <> pg_backend_pid()"
-            )
-            await conn.execute(text(query))
+        yield engine
+    finally:
+        await engine.dispose()
 
-        # Clean tables before the test
-        async with clean_engine.begin() as conn:
-            assert sqlalchemy_config.metadata is not None
-            for table in reversed(sqlalchemy_config.metadata.sorted_tables):
-                await conn.execute(text(f"TRUNCATE TABLE {table.name} CASCADE"))
 
-        yield
+@pytest_asyncio.fixture(scope="function")
+async def clean_database(db_engine: AsyncEngine) -> None:
+    """Clean database between tests by truncating all tables.
 
-    finally:
-        await clean_engine.dispose()
-        await terminator_engine.dispose()
+    The shared test app keeps its pooled connection open across tests; it is idle
+    between requests, so it does not block the TRUNCATE.
+    """
+    from app.db import sqlalchemy_config
 
+    # Clean tables before the test, all in one statement
+    assert sqlalchemy_config.metadata is not None
+    table_names = ", ".join(table.name for table in reversed(sqlalchemy_config.metadata.sorted_tables))
+    async with db_engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
 
-@pytest_asyncio.fixture(scope="function")
-async def client(session_database: dict[str, str], clean_database: None) -> AsyncIterator[AsyncTestClient]:
-    """Create a test client."""
+
+@pytest_asyncio.fixture(scope="session")
+async def test_app(session_database: dict[str, str]) -> Litestar:
+    """Create the test application once per session (per worker)."""
     from pydantic import AnyUrl, SecretStr
     from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
     from app.main import create_app
 
-    _ = clean_database
-
     class TestSettings(Settings):
         """Test-specific settings that don't use TOML config."""
 
@@ -161,7 +151,7 @@ async def client(session_database: dict[str, str], clean_database: None) -> Asyn
         ),
     )
 
-    test_app = create_app(
+    return create_app(
         app_settings=test_settings,
         title="Test PM API",
         enable_structlog=False,
@@ -169,5 +159,26 @@ async def client(session_database: dict[str, str], clean_database: None) -> Asyn
         max_overflow=0,
     )
 
+
+@pytest_asyncio.fixture(scope="session")
+async def session_client(test_app: Litestar) -> AsyncIterator[AsyncTestClient]:
+    """Start the test application once per session and share one client for it."""
     async with AsyncTestClient(app=test_app) as test_client:
         yield test_client
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(session_client: AsyncTestClient, clean_database: None) -> AsyncIterator[AsyncTestClient]:
+    """Provide the shared test client, logged out and with empty in-process caches."""
+    from app.api.accounts.auth.security import clear_user_cache
+    from app.api.accounts.permissions.services import clear_permission_list_cache
+
+    _ = clean_database
+
+    session_client.cookies.clear()
+    clear_user_cache()
+    clear_permission_list_cache()
+
+    yield session_client
+
+    session_client.cookies.clear()